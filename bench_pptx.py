@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Fine Jewellery's — PowerPoint generator benchmarks.
+
+    python bench_pptx.py                    # run every case, compare to baseline
+    python bench_pptx.py reference save     # run some cases
+    python bench_pptx.py --save-baseline    # record the current numbers
+
+Each case runs in a fresh interpreter (so peak RSS is its own) against
+fixture images generated on the fly — nothing is read from the network or
+the user's machine.  Reported per case: slides/sec, peak RSS and output
+size.  With a baseline present the run fails (exit 1) when a case is
+slower, bigger or hungrier than the baseline by more than ``--threshold``.
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(HERE, "bench_baseline.json")
+
+# ── Fixtures ───────────────────────────────────────────────────────────────
+def make_screenshots(folder, count=20, size=(1920, 1840)):
+    """Write ``count`` synthetic UI-like PNGs; return their paths."""
+    from PIL import Image, ImageDraw
+    rnd = random.Random(1771445921)
+    paths = []
+    for n in range(count):
+        img = Image.new("RGB", size, (246, 242, 232))
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, size[0], 120], fill=(13, 13, 13))
+        for _ in range(120):
+            x0, y0 = rnd.randrange(size[0]), rnd.randrange(140, size[1])
+            x1, y1 = x0 + rnd.randrange(40, 400), y0 + rnd.randrange(20, 300)
+            draw.rectangle([x0, y0, x1, y1], fill=tuple(rnd.randrange(256) for _ in range(3)))
+        path = os.path.join(folder, f"screen{n:02d}.png")
+        img.save(path)
+        paths.append(path)
+    return paths
+
+# ── Cases ──────────────────────────────────────────────────────────────────
+# Each case builds something in ``tmp`` and returns slides, seconds, bytes.
+def _timed_build(g, spec, output):
+    start = time.perf_counter()
+    prs = g.build_deck(spec, output)
+    return {"slides": len(prs.slides), "seconds": time.perf_counter() - start,
+            "bytes": os.path.getsize(output)}
+
+def case_reference(g, tmp):
+    """The 15-slide reference deck."""
+    shots = make_screenshots(tmp, count=len(g.DEFAULT_SPEC["screenshots"]))
+    spec = {"screenshots": dict(zip(g.DEFAULT_SPEC["screenshots"], shots))}
+    return _timed_build(g, spec, os.path.join(tmp, "reference.pptx"))
+
+def case_cards(g, tmp, slides=500):
+    """500 slides of feature-grid text cards."""
+    spec = {"slides": ["features"] * slides}
+    return _timed_build(g, spec, os.path.join(tmp, "cards.pptx"))
+
+def _screenshot_spec(g, tmp, slides):
+    shots = make_screenshots(tmp)
+    bullets = g.DEFAULT_SPEC["screenshot_slides"][0][3]
+    return {"slides": ["screenshots"],
+            "screenshots": {f"s{n}": p for n, p in enumerate(shots)},
+            "screenshot_slides": [(i + 1, f"Page {i + 1}", f"s{i % len(shots)}", bullets)
+                                  for i in range(slides)]}
+
+def case_screenshots(g, tmp, slides=500):
+    """500 screenshot slides over 20 synthetic PNGs."""
+    return _timed_build(g, _screenshot_spec(g, tmp, slides), os.path.join(tmp, "screenshots.pptx"))
+
+def _drain(sock, stats):
+    """Read ``sock`` to EOF, noting when the first and last bytes arrived."""
+    stats["bytes"] = 0
+    while True:
+        chunk = sock.recv(1 << 16)
+        if not chunk:
+            break
+        stats.setdefault("first", time.perf_counter())
+        stats["bytes"] += len(chunk)
+    stats["done"] = time.perf_counter()
+
+def case_stream(g, tmp, slides=500):
+    """A 500-slide screenshot deck delivered to a reader over a socket (as
+    an upload would be): saved to a file and read back, built into a
+    BytesIO, or streamed slide by slide with build_catalogue."""
+    spec = _screenshot_spec(g, tmp, slides)
+    path = os.path.join(tmp, "stream.pptx")
+    g.build_deck(spec, io.BytesIO())        # prepare the images once, outside the timings
+
+    def via_file(out):
+        g.build_deck(spec, path)
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, out, 1 << 16)
+        return 2 * os.path.getsize(path)    # written, then read back
+
+    def via_memory(out):
+        buf = io.BytesIO()
+        g.build_deck(spec, buf)
+        out.write(buf.getbuffer())
+        return 0
+
+    def streamed(out):
+        g.build_catalogue(spec, out)
+        return 0
+
+    runs = {}
+    for name, deliver in (("file", via_file), ("memory", via_memory), ("stream", streamed)):
+        reader, writer = socket.socketpair()
+        stats = {}
+        thread = threading.Thread(target=_drain, args=(reader, stats))
+        thread.start()
+        start = time.perf_counter()
+        with writer.makefile("wb") as out:
+            disk = deliver(out)
+        writer.shutdown(socket.SHUT_WR)
+        thread.join()
+        writer.close()
+        reader.close()
+        runs[name] = (stats["first"] - start, stats["done"] - start, disk, stats["bytes"])
+    return {"slides": slides, "seconds": runs["stream"][1], "bytes": runs["stream"][3],
+            "note": "  ".join(f"{name}: first byte {first:.2f}s, done {done:.2f}s, "
+                              f"{disk / 2**20:.1f} MB disk"
+                              for name, (first, done, disk, _) in runs.items())}
+
+def case_save(g, tmp, slides=1000):
+    """Serialization only: save an already built 1,000-slide card deck,
+    parallel save_presentation vs python-pptx's own prs.save."""
+    prs = g.new_presentation()
+    features = g.DEFAULT_SPEC["features"]
+    for _ in range(slides):
+        g.build_features(g.blank_slide(prs), features)
+    timings = {}
+    for name, save in (("prs.save", prs.save), ("parallel", lambda out: g.save_presentation(prs, out))):
+        out = io.BytesIO()
+        start = time.perf_counter()
+        save(out)
+        timings[name] = time.perf_counter() - start
+    return {"slides": slides, "seconds": timings["parallel"], "bytes": len(out.getvalue()),
+            "note": f"prs.save {timings['prs.save']:.2f}s -> {timings['parallel']:.2f}s on "
+                    f"{os.cpu_count()} CPUs ({timings['prs.save'] / timings['parallel']:.2f}x)"}
+
+def case_shapes(g, tmp, slides=200):
+    """Per-shape build time, style prototypes vs per-attribute setters."""
+    from pptx.util import Inches, Pt
+
+    def card_slide(slide, i):
+        for j in range(8):
+            x, y = Inches(0.4 + (j % 4) * 3.2), Inches(2.0 + (j // 4) * 2.4)
+            g.add_rect(slide, x, y, Inches(3.0), Inches(2.1), **g.STYLES["card"])
+            g.add_text(slide, "💎", x, y, Inches(2.8), Inches(0.55), font_size=Pt(24))
+            g.add_text(slide, f"Card {i}.{j}", x, y + Inches(0.7), Inches(2.8), Inches(0.4),
+                       font_size=Pt(12), bold=True, color=g.GOLD_LIGHT)
+            g.add_text(slide, "Persistent localStorage cart with quantity management",
+                       x, y + Inches(1.1), Inches(2.8), Inches(0.85), **g.STYLES["gold_label"])
+
+    timings = {}
+    for cached in (False, True):
+        g.STYLE_CACHE = cached
+        prs = g.new_presentation()
+        start = time.perf_counter()
+        for i in range(slides):
+            card_slide(g.blank_slide(prs), i)
+        timings[cached] = time.perf_counter() - start
+    g.STYLE_CACHE = True
+    shapes = slides * 8 * 4
+    return {"slides": slides, "seconds": timings[True], "bytes": 0,
+            "note": f"{timings[False] / shapes * 1e6:.0f} -> {timings[True] / shapes * 1e6:.0f} µs/shape "
+                    f"with prototypes ({timings[False] / timings[True]:.2f}x)"}
+
+CASES = {
+    "reference": case_reference,
+    "cards": case_cards,
+    "screenshots": case_screenshots,
+    "save": case_save,
+    "stream": case_stream,
+    "shapes": case_shapes,
+}
+
+# ── Runner ─────────────────────────────────────────────────────────────────
+def _child(name):
+    """Run one case in this (fresh) process and print its metrics as JSON."""
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DECK_CACHE_DIR"] = os.path.join(tmp, "cache")
+        sys.path.insert(0, HERE)
+        import deck_engine as g
+        metrics = CASES[name](g, tmp)
+    metrics["slides_per_sec"] = metrics["slides"] / metrics["seconds"]
+    metrics["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(metrics))
+
+def run_case(name):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+def regressions(name, metrics, base, threshold):
+    """Human-readable list of metrics worse than ``base`` by more than ``threshold``."""
+    found = []
+    if metrics["slides_per_sec"] < base["slides_per_sec"] * (1 - threshold):
+        found.append(f"{name}: {metrics['slides_per_sec']:.1f} slides/s "
+                     f"(baseline {base['slides_per_sec']:.1f})")
+    for key, unit in (("peak_rss_mb", "MB peak"), ("bytes", "bytes")):
+        if base[key] and metrics[key] > base[key] * (1 + threshold):
+            found.append(f"{name}: {metrics[key]:.1f} {unit} (baseline {base[key]:.1f})")
+    return found
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("cases", nargs="*", metavar="CASE",
+                        help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed relative regression (default: %(default)s)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        _child(args.child)
+        return 0
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results, failures = {}, []
+    for name in args.cases or CASES:
+        m = results[name] = run_case(name)
+        print(f"{name:12s} {m['slides']:5d} slides  {m['slides_per_sec']:8.1f} slides/s  "
+              f"{m['peak_rss_mb']:7.1f} MB peak  {m['bytes'] / 1024:9.0f} KB"
+              + (f"  [{m['note']}]" if "note" in m else ""))
+        if name in baseline:
+            failures += regressions(name, m, baseline[name], args.threshold)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    for line in failures:
+        print(f"❌ regression: {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
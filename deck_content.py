@@ -0,0 +1,249 @@
+"""
+Fine Jewellery's — deck content and section schema.
+
+Pure data, no third-party imports: the default deck spec, the slide
+sections the engine knows how to draw (and which spec keys each reads),
+and the slide plan derived from a spec.  Everything that only needs to
+*describe* a deck — listing its slides, validating a spec file — works
+from this module without loading python-pptx.
+"""
+
+import hashlib
+import os
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ── Paths ──────────────────────────────────────────────────────────────────
+ARTIFACTS = "/Users/aniket/.gemini/antigravity/brain/e1480d75-4e98-4529-875c-b7236ac34c1e"
+# Under the untracked build/ folder: a plain run on a checkout without the
+# ARTIFACTS screenshots must not overwrite the committed deck.
+OUTPUT = os.environ.get("DECK_OUTPUT", os.path.join(HERE, "build", "Fine_Jewellery_Presentation.pptx"))
+CACHE_DIR = os.environ.get(
+    "DECK_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "fine-jewellery-pptx"))
+
+SCREENSHOTS = {
+    "homepage":       os.path.join(ARTIFACTS, "slide_homepage_1771445921278.png"),
+    "products":       os.path.join(ARTIFACTS, "slide_products_1771445932814.png"),
+    "product_detail": os.path.join(ARTIFACTS, "slide_product_detail_retry_1771445960252.png"),
+    "cart":           os.path.join(ARTIFACTS, "slide_cart_1771445971627.png"),
+    "wishlist":       os.path.join(ARTIFACTS, "slide_wishlist_1771445981728.png"),
+    "auth":           os.path.join(ARTIFACTS, "slide_auth_1771445991221.png"),
+    "checkout":       os.path.join(ARTIFACTS, "slide_checkout_1771446000797.png"),
+}
+
+# ── Sections ───────────────────────────────────────────────────────────────
+# section name -> (spec keys its builder reads, spec list it expands over).
+# A section with ``each`` set emits one slide per item of that list, passed
+# to the builder as ``item``; the builders live in deck_engine.
+SECTIONS = {
+    "title":        (("stats", "presenter"), None),
+    "overview":     (("desc", "bullets", "info"), None),
+    "tech_stack":   (("tech",), None),
+    "screenshots":  (("screenshots",), "screenshot_slides"),
+    "products":     ((), "products"),
+    "architecture": (("fe_items", "be_items", "arch_stats"), None),
+    "schema":       (("schemas",), None),
+    "features":     (("features",), None),
+    "challenges":   (("challenges",), None),
+    "thank_you":    (("contacts",), None),
+    # Analytics of an order export (see deck_sales); not in the default deck
+    "sales_summary":   (("orders",), None),
+    "sales_breakdown": (("orders",), None),
+    "sales_products":  (("orders",), None),
+    "sales_trend":     (("orders",), None),
+}
+
+# ── Deck content ───────────────────────────────────────────────────────────
+DEFAULT_SPEC = {
+    "slides": ["title", "overview", "tech_stack", "screenshots",
+               "architecture", "schema", "features", "challenges", "thank_you"],
+    "screenshots": SCREENSHOTS,
+    "stats": [("15", "SLIDES"), ("7+", "PAGES"), ("Full", "STACK"), ("Live", "DEMO")],
+    "presenter": "Presented by  Aniket   ·   Fine Jewellery's E-Commerce Project   ·   2026",
+    "desc": ("Fine Jewellery's is a full-stack luxury e-commerce platform built to showcase and sell "
+             "premium handcrafted jewellery. The platform offers a seamless shopping experience with "
+             "a modern, elegant UI inspired by high-end jewellery brands."),
+    "bullets": [
+        "✦  Complete e-commerce flow from browsing to checkout",
+        "✦  User authentication with JWT tokens",
+        "✦  Persistent wishlist synced to MongoDB",
+        "✦  Shopping cart with quantity management",
+        "✦  Responsive design for all screen sizes",
+        "✦  BIS Hallmarked jewellery catalogue",
+    ],
+    "info": [
+        ("PROJECT TYPE", "Full-Stack Web Application"),
+        ("DOMAIN", "Luxury E-Commerce / Jewellery"),
+        ("TARGET USERS", "Jewellery shoppers across India"),
+        ("DEPLOYMENT", "Local Dev · Cloud-ready"),
+    ],
+    "tech": [
+        ("⚛️ React 18 + TypeScript", "Component-based UI with full type safety and modern hooks"),
+        ("⚡ Vite", "Lightning-fast build tool and dev server with HMR"),
+        ("🎨 Tailwind CSS", "Utility-first CSS framework for rapid, consistent styling"),
+        ("🟢 Node.js + Express", "RESTful API backend with middleware-based architecture"),
+        ("🍃 MongoDB + Mongoose", "NoSQL database with schema validation and Atlas cloud hosting"),
+        ("🔐 JWT Authentication", "Stateless auth with bcrypt password hashing"),
+        ("🔀 React Router v6", "Client-side routing with protected routes and navigation"),
+        ("🧩 Radix UI + shadcn", "Accessible component primitives with custom theming"),
+        ("🔔 Sonner Toasts", "Beautiful animated toast notifications for user feedback"),
+    ],
+    "screenshot_slides": [
+        (4, "Homepage",         "homepage",       [
+            "Auto-rotating hero carousel with 3 banners",
+            "Top announcement bar with offers",
+            "Smart search bar with placeholder hints",
+            "Category navigation: Gold, Silver, Men, Women",
+            "Wishlist & Cart count badges in header",
+            "Delivery pincode selector",
+        ]),
+        (5, "Product Listing",  "products",       [
+            "Grid layout with hover animations",
+            "Filter by category, material, price range",
+            "NEW & BESTSELLER badges on cards",
+            "Quick 'Add to Cart' on hover",
+            "Heart icon for instant wishlist toggle",
+            "Star ratings and review counts",
+        ]),
+        (6, "Product Detail",   "product_detail", [
+            "High-res product image gallery (4 views)",
+            "Breadcrumb navigation",
+            "Quantity selector with +/- controls",
+            "Add to Cart & Wishlist buttons",
+            "Buy Now → direct checkout",
+            "Related products section",
+        ]),
+        (7, "Shopping Cart",    "cart",           [
+            "Persistent cart saved in localStorage",
+            "Quantity update with +/- controls",
+            "Remove individual items",
+            "Real-time price calculation",
+            "Order summary with subtotal",
+            "Proceed to Checkout CTA",
+        ]),
+        (8, "Wishlist Feature", "wishlist",       [
+            "Synced to MongoDB when logged in",
+            "localStorage fallback when not logged in",
+            "Optimistic UI — instant heart toggle",
+            "Move to Cart with one click",
+            "Wishlist count badge in header",
+            "Persists across sessions",
+        ]),
+        (9, "Login & Sign Up",  "auth",           [
+            "JWT-based stateless authentication",
+            "bcrypt password hashing (12 rounds)",
+            "Token stored in localStorage",
+            "Auto-login on page refresh",
+            "Form validation with error messages",
+            "Protected routes for authenticated users",
+        ]),
+        (10, "Checkout Page",   "checkout",       [
+            "Shipping address form",
+            "Order summary with item list",
+            "Price breakdown (subtotal, shipping, total)",
+            "Payment method selection",
+            "Free shipping on all orders",
+            "Order confirmation flow",
+        ]),
+    ],
+    "fe_items": ["React 18 + TypeScript + Vite", "AuthContext — JWT token management",
+                 "CartContext — cart & wishlist state", "React Router v6 — client routing",
+                 "Tailwind CSS + Radix UI", "Sonner toast notifications",
+                 "localStorage for cart persistence"],
+    "be_items": ["Express.js REST API server", "JWT middleware — route protection",
+                 "bcryptjs — password hashing", "Mongoose ODM — MongoDB models",
+                 "CORS configured for port 8080", "Routes: /auth, /wishlist, /orders",
+                 "MongoDB Atlas — cloud database"],
+    "arch_stats": [("Frontend Port", ":8080"), ("Backend Port", ":5000"),
+                   ("Database", "MongoDB Atlas"), ("Auth", "JWT + bcrypt")],
+    "schemas": [
+        ("👤 User Model", [
+            ("_id", "ObjectId"), ("name", "String *"), ("email", "String * unique"),
+            ("phone", "String *"), ("password", "String * hashed"),
+            ("role", "user | admin"), ("isActive", "Boolean"), ("createdAt", "Date"),
+        ]),
+        ("❤️ Wishlist Model", [
+            ("_id", "ObjectId"), ("user", "→ User ref"), ("items[]", "Array"),
+            ("  productId", "String *"), ("  name", "String *"),
+            ("  image", "String *"), ("  price", "Number *"), ("  material", "String"),
+        ]),
+        ("📦 Order Model", [
+            ("_id", "ObjectId"), ("user", "→ User ref"), ("items[]", "Array"),
+            ("  productId", "String"), ("  quantity", "Number"),
+            ("totalAmount", "Number *"), ("status", "pending|confirmed"),
+            ("shippingAddress", "Object"),
+        ]),
+    ],
+    "features": [
+        ("🔐", "Secure Auth", "JWT tokens, bcrypt hashing, protected routes, auto-login"),
+        ("🛒", "Smart Cart", "Persistent localStorage cart with quantity management"),
+        ("❤️", "Wishlist Sync", "MongoDB-backed wishlist with optimistic UI updates"),
+        ("🔍", "Smart Search", "Search across products by name, category, material"),
+        ("📱", "Responsive", "Fully responsive design for mobile, tablet, desktop"),
+        ("🏷️", "Filters", "Filter by category, material, price range, new arrivals"),
+        ("🌙", "Dark Mode", "Elegant dark theme with gold accents throughout"),
+        ("🔔", "Notifications", "Animated toast notifications for all user actions"),
+    ],
+    "challenges": [
+        ("MongoDB Atlas DNS SRV records couldn't be resolved by local ISP DNS, causing backend connection failure",
+         "Replaced mongodb+srv:// URI with direct shard hostnames discovered via Google DNS (8.8.8.8)"),
+        ("Wishlist adding silently failed — async API calls were fired without await, so UI state never updated",
+         "Added optimistic UI updates, proper async/await in all handlers, boolean returns, and state revert on failure"),
+        ("Rollup native module @rollup/rollup-darwin-arm64 missing due to npm optional dependency bug on Apple Silicon",
+         "Deleted node_modules and package-lock.json, then ran a clean npm install to resolve platform-specific binaries"),
+    ],
+    "contacts": [("🌐", "LIVE URL", "localhost:8080"), ("⚙️", "API SERVER", "localhost:5000"),
+                 ("🍃", "DATABASE", "MongoDB Atlas"), ("👤", "DEVELOPER", "Aniket")],
+    # Catalogue decks: any iterable of product mappings, see build_product
+    "products": [],
+    # Sales slides: path of a .jsonl or .csv order export, see deck_sales
+    "orders": "",
+}
+
+# ── Plan ───────────────────────────────────────────────────────────────────
+def plan_deck(spec):
+    """Yield ``(section name, data)`` for every slide of ``spec``, in order."""
+    for name in spec["slides"]:
+        inputs, each = SECTIONS[name]
+        data = {key: spec[key] for key in inputs}
+        if each is None:
+            yield name, data
+        else:
+            for item in spec[each]:
+                yield name, dict(data, item=item)
+
+# ── Cache files ────────────────────────────────────────────────────────────
+def file_hash(path):
+    """SHA-256 of the contents of ``path``, read in 1 MiB chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def write_atomic(path, data):
+    """Write ``data`` to ``path`` through a temporary file in the same
+    folder, so concurrent readers see the old file or the new, never half."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+# Files whose contents decide how a plan is drawn; any edit to them
+# invalidates incremental fingerprints and cached spec plans.
+ENGINE_SOURCES = ("deck_content.py", "deck_engine.py", "deck_images.py", "deck_layout.py",
+                  "deck_sales.py", "deck_text.py")
+
+_code_version = None
+
+def code_version():
+    """Fingerprint of the deck-drawing code itself."""
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha256()
+        for name in ENGINE_SOURCES:
+            with open(os.path.join(HERE, name), "rb") as f:
+                h.update(f.read())
+        _code_version = h.hexdigest()
+    return _code_version
@@ -0,0 +1,842 @@
+"""
+Fine Jewellery's — PowerPoint deck engine.
+
+Shape helpers, the slide builders and the build entry points behind
+``generate_pptx.py``.  ``build_deck(spec, output)`` builds one deck from a
+spec dict (any key of ``DEFAULT_SPEC`` may be overridden).  The python-pptx
+import and the default template are paid for once per process, so a
+long-lived worker can build many deck variants back to back.
+"""
+
+import copy
+import os
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pptx import Presentation
+from pptx.util import Inches, Pt, Emu
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION, XL_MARKER_STYLE
+from pptx.enum.text import PP_ALIGN
+
+from deck_content import DEFAULT_SPEC, OUTPUT, SECTIONS, code_version, plan_deck
+from deck_images import Prefetcher, image_part, load_image, warn_missing
+from deck_layout import layout, slide_pictures
+from deck_model import Chart, Picture, Rect, SlideModel, Table, Text
+from deck_package import COMPRESSLEVEL, PackageWriter, drop_slide, save_presentation
+from deck_sales import sales_report, trend
+from deck_text import fit_font_size, metrics_source
+from deck_snapshots import (PreviousBuild, SlideCache, graft_slide, slide_fingerprint,
+                            snapshot_slide, write_sidecar)
+
+# ── Colors ─────────────────────────────────────────────────────────────────
+GOLD        = RGBColor(0xC9, 0xA8, 0x4C)
+GOLD_LIGHT  = RGBColor(0xE8, 0xC9, 0x7A)
+DARK        = RGBColor(0x0D, 0x0D, 0x0D)
+DARK2       = RGBColor(0x1A, 0x1A, 0x1A)
+DARK3       = RGBColor(0x25, 0x25, 0x25)
+WHITE       = RGBColor(0xFA, 0xFA, 0xFA)
+MUTED       = RGBColor(0x88, 0x88, 0x88)
+RED         = RGBColor(0xEE, 0x55, 0x55)
+
+# ── Slide size: 16:9 widescreen ────────────────────────────────────────────
+W = Inches(13.33)
+H = Inches(7.5)
+
+_template = None
+
+def new_presentation():
+    """Return an empty 16:9 presentation cloned from the cached template."""
+    global _template
+    if _template is None:
+        _template = Presentation()
+        _template.slide_width  = W
+        _template.slide_height = H
+    return copy.deepcopy(_template)
+
+def blank_slide(prs):
+    blank_layout = prs.slide_layouts[6]  # completely blank
+    return prs.slides.add_slide(blank_layout)
+
+def fill_bg(slide, color):
+    if isinstance(slide, SlideModel):
+        slide.background = color
+        return
+    bg = slide.background
+    fill = bg.fill
+    fill.solid()
+    fill.fore_color.rgb = color
+
+# ── Shape styles ───────────────────────────────────────────────────────────
+# add_rect / add_text build each distinct style once, as a prototype <p:sp>
+# on a scratch slide.  Every later shape of that style is a deep copy of the
+# prototype with only id, name, geometry and text patched — one tree copy
+# instead of a dozen lxml mutations per shape.
+CARD_BORDER = RGBColor(0x40, 0x35, 0x15)
+
+STYLES = {
+    "card":       dict(fill_color=DARK3, line_color=CARD_BORDER),
+    "gold_label": dict(font_size=Pt(9), color=GOLD, bold=True),
+}
+
+STYLE_CACHE = True
+AUTO_FIT = True   # shrink ``fit=True`` text until it fits its box, see deck_text
+_prototypes = {}
+_scratch = None
+
+def _scratch_slide():
+    global _scratch
+    if _scratch is None:
+        _scratch = blank_slide(new_presentation())
+    return _scratch
+
+def _prototype(key, build):
+    proto = _prototypes.get(key)
+    if proto is None:
+        shape = build(_scratch_slide())
+        proto = _prototypes[key] = shape._element
+        proto.getparent().remove(proto)
+    return proto
+
+def _stamp(slide, proto, basename, left, top, width, height):
+    sp = copy.deepcopy(proto)
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    cNvPr = sp.nvSpPr.cNvPr
+    cNvPr.id = shape_id
+    cNvPr.name = f"{basename} {shape_id - 1}"
+    sp.x, sp.y, sp.cx, sp.cy = left, top, width, height
+    shapes._spTree.insert_element_before(sp, "p:extLst")
+    return shapes._shape_factory(sp)
+
+def _build_rect(slide, left, top, width, height, fill_color, line_color, line_width):
+    shape = slide.shapes.add_shape(
+        1,  # MSO_SHAPE_TYPE.RECTANGLE
+        left, top, width, height
+    )
+    if fill_color:
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = fill_color
+    else:
+        shape.fill.background()
+    if line_color:
+        shape.line.color.rgb = line_color
+        shape.line.width = line_width
+    else:
+        shape.line.fill.background()
+    return shape
+
+def add_rect(slide, left, top, width, height, fill_color=None, line_color=None, line_width=Pt(1)):
+    if isinstance(slide, SlideModel):
+        return slide.add(Rect(left, top, width, height, fill_color, line_color, line_width))
+    if not STYLE_CACHE:
+        return _build_rect(slide, left, top, width, height, fill_color, line_color, line_width)
+    key = ("rect", fill_color, line_color, line_width if line_color else None)
+    proto = _prototype(key, lambda s: _build_rect(s, 0, 0, 0, 0, fill_color, line_color, line_width))
+    return _stamp(slide, proto, "Rectangle", left, top, width, height)
+
+def _build_text(slide, text, left, top, width, height,
+                font_size, bold, color, align, font_name, italic):
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.alignment = align
+    run = p.add_run()
+    run.text = text
+    run.font.size = font_size
+    run.font.bold = bold
+    run.font.italic = italic
+    run.font.color.rgb = color
+    run.font.name = font_name
+    return txBox
+
+def add_text(slide, text, left, top, width, height,
+             font_size=Pt(14), bold=False, color=WHITE,
+             align=PP_ALIGN.LEFT, font_name="Calibri", italic=False, fit=False):
+    if fit and AUTO_FIT:
+        font_size = Pt(fit_font_size(text, width, height, font_name, font_size.pt, bold))
+    if isinstance(slide, SlideModel):
+        return slide.add(Text(text, left, top, width, height, font_size, bold, color, align, font_name, italic))
+    style = (font_size, bold, color, align, font_name, italic)
+    if not STYLE_CACHE:
+        return _build_text(slide, text, left, top, width, height, *style)
+    proto = _prototype(("text",) + style, lambda s: _build_text(s, "", 0, 0, 0, 0, *style))
+    txBox = _stamp(slide, proto, "TextBox", left, top, width, height)
+    txBox._element.txBody.p_lst[0].r_lst[0].text = text
+    return txBox
+
+def add_picture(slide, path, left, top, width, height):
+    """Embed ``path`` downsampled to the resolution of its placement box.
+    Identical images share one media part per package.  A missing file
+    embeds nothing and returns None."""
+    if isinstance(slide, SlideModel):
+        return slide.add(Picture(path, left, top, width, height))
+    blob = load_image(path, width, height)
+    if blob is None:
+        return None         # missing file: reported by the Prefetcher, left out
+    part, rId = image_part(slide, blob)
+    pic = slide.shapes._add_pic_from_image_part(part, rId, left, top, width, height)
+    pic.nvPicPr.cNvPr.set("descr", os.path.basename(path))
+    return slide.shapes._shape_factory(pic)
+
+def _split(total, weights):
+    """``total`` EMU divided in proportion to ``weights``, summing exactly."""
+    whole, edges = sum(weights), [0]
+    for i in range(1, len(weights) + 1):
+        edges.append(round(total * sum(weights[:i]) / whole))
+    return [b - a for a, b in zip(edges, edges[1:])]
+
+def _table_cell(cell, text, font_size, color, fill, bold, align):
+    cell.fill.solid()
+    cell.fill.fore_color.rgb = fill
+    cell.margin_top = cell.margin_bottom = Pt(2)
+    p = cell.text_frame.paragraphs[0]
+    p.alignment = align
+    run = p.add_run()
+    run.text = text
+    run.font.size = font_size
+    run.font.bold = bold
+    run.font.color.rgb = color
+    run.font.name = "Calibri"
+
+def add_table(slide, rows, left, top, width, height, font_size=Pt(10), widths=None, right=()):
+    """Native table of ``rows`` (the first is the header): a gold header
+    over alternating dark rows.  ``widths`` are relative column widths;
+    columns whose index is in ``right`` (figures) are right-aligned."""
+    rows = tuple(tuple(str(v) for v in r) for r in rows)
+    widths, right = tuple(widths or (1,) * len(rows[0])), tuple(right)
+    if isinstance(slide, SlideModel):
+        return slide.add(Table(rows, left, top, width, height, font_size, widths, right))
+    frame = slide.shapes.add_table(len(rows), len(rows[0]), left, top, width, height)
+    table = frame.table
+    table.horz_banding = False
+    for column, w in zip(table.columns, _split(width, widths)):
+        column.width = w
+    for r, values in enumerate(rows):
+        for c, value in enumerate(values):
+            _table_cell(table.cell(r, c), value, font_size,
+                        DARK if r == 0 else WHITE, GOLD if r == 0 else (DARK3 if r % 2 else DARK2),
+                        r == 0, PP_ALIGN.RIGHT if c in right else PP_ALIGN.LEFT)
+    return frame
+
+def add_chart(slide, kind, categories, series, left, top, width, height, number_format="#,##0"):
+    """Native ``"bar"`` (horizontal, first category on top) or ``"line"``
+    chart of ``series`` — ``(name, values)`` pairs over ``categories`` —
+    in the deck's gold-on-dark style."""
+    categories = tuple(categories)
+    series = tuple((name, tuple(values)) for name, values in series)
+    if isinstance(slide, SlideModel):
+        return slide.add(Chart(kind, categories, series, left, top, width, height, number_format))
+    data = CategoryChartData(number_format=number_format)
+    data.categories = categories
+    for name, values in series:
+        data.add_series(name, values)
+    chart_type = XL_CHART_TYPE.BAR_CLUSTERED if kind == "bar" else XL_CHART_TYPE.LINE
+    frame = slide.shapes.add_chart(chart_type, left, top, width, height, data)
+    chart = frame.chart
+    chart.has_legend = len(series) > 1
+    chart.font.size = Pt(9)
+    chart.font.color.rgb = MUTED
+    value_axis, category_axis = chart.value_axis, chart.category_axis
+    value_axis.tick_labels.number_format = number_format
+    value_axis.tick_labels.number_format_is_linked = False
+    value_axis.major_gridlines.format.line.color.rgb = DARK3
+    value_axis.format.line.fill.background()
+    category_axis.format.line.color.rgb = DARK3
+    plot = chart.plots[0]
+    if kind == "bar":
+        category_axis.reverse_order = True
+        plot.gap_width = 60
+        plot.has_data_labels = True
+        labels = plot.data_labels
+        labels.number_format, labels.number_format_is_linked = number_format, False
+        labels.position = XL_LABEL_POSITION.OUTSIDE_END
+        labels.font.color.rgb = GOLD_LIGHT
+    for s in plot.series:
+        if kind == "bar":
+            s.format.fill.solid()
+            s.format.fill.fore_color.rgb = GOLD
+        else:
+            s.format.line.color.rgb = GOLD
+            s.format.line.width = Pt(2.25)
+            s.marker.style = XL_MARKER_STYLE.NONE
+            s.smooth = False
+    return frame
+
+def add_gold_line(slide, left, top, width=Inches(0.8)):
+    rect = add_rect(slide, left, top, width, Pt(3), fill_color=GOLD)
+    return rect
+
+def slide_label(slide, text):
+    add_text(slide, text, Inches(0.6), Inches(0.35), Inches(6), Inches(0.3),
+             font_name="Calibri", **STYLES["gold_label"])
+
+def slide_number_label(slide, num, label):
+    slide_label(slide, f"{num:02d}  —  {label.upper()}")
+
+def section_title(slide, title, top=Inches(0.7)):
+    add_text(slide, title, Inches(0.6), top, Inches(12), Inches(0.9),
+             font_size=Pt(36), bold=True, color=WHITE, font_name="Georgia")
+
+# ── Builder registry ───────────────────────────────────────────────────────
+# Each slide block is a function ``fn(slide, **data)`` registered under a
+# section name of ``deck_content.SECTIONS``, which declares the spec keys it
+# reads (``inputs``) and the spec list it expands over (``each``).
+#
+# A ``cacheable`` section draws nothing but its inputs (no slide numbers
+# that depend on its position, no per-deck state), so its finished slide
+# can be reused by any deck with the same inputs, see ``SLIDE_CACHE``.
+SlideBuilder = namedtuple("SlideBuilder", "fn inputs each cacheable")
+
+SLIDE_BUILDERS = {}
+
+def slide_builder(name, cacheable=False):
+    inputs, each = SECTIONS[name]
+    def register(fn):
+        SLIDE_BUILDERS[name] = SlideBuilder(fn, inputs, each, cacheable)
+        return fn
+    return register
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 1 — Title
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("title")
+def build_title(slide, stats, presenter):
+    fill_bg(slide, DARK)
+
+    # Gold glow rectangle (decorative)
+    add_rect(slide, Inches(2), Inches(1.2), Inches(9.33), Inches(5.1), fill_color=RGBColor(0x1A, 0x12, 0x00))
+
+    # Diamond emoji / icon area
+    add_text(slide, "💎", Inches(5.5), Inches(0.8), Inches(2.33), Inches(0.8),
+             font_size=Pt(40), align=PP_ALIGN.CENTER, color=WHITE)
+
+    # Main title
+    add_text(slide, "Fine Jewellery's",
+             Inches(1), Inches(1.6), Inches(11.33), Inches(1.5),
+             font_size=Pt(60), bold=True, color=GOLD_LIGHT,
+             align=PP_ALIGN.CENTER, font_name="Georgia")
+
+    # Subtitle
+    add_text(slide, "E-COMMERCE PLATFORM  —  PROJECT PRESENTATION",
+             Inches(1), Inches(3.1), Inches(11.33), Inches(0.5),
+             font_size=Pt(14), color=MUTED, align=PP_ALIGN.CENTER, bold=False)
+
+    # Gold line
+    add_gold_line(slide, Inches(6.1), Inches(3.7), Inches(1.1))
+
+    # Stats row
+    for (num, lbl), cell in zip(stats, layout("title.stats", len(stats))):
+        add_text(slide, num, *cell.num,
+                 font_size=Pt(28), bold=True, color=GOLD, align=PP_ALIGN.CENTER, font_name="Georgia")
+        add_text(slide, lbl, *cell.label,
+                 font_size=Pt(9), color=MUTED, align=PP_ALIGN.CENTER)
+
+    # Presenter line
+    add_text(slide, presenter,
+             Inches(1), Inches(5.5), Inches(11.33), Inches(0.4),
+             font_size=Pt(11), color=MUTED, align=PP_ALIGN.CENTER)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 2 — Project Overview
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("overview")
+def build_overview(slide, desc, bullets, info):
+    fill_bg(slide, DARK2)
+    slide_number_label(slide, 2, "Overview")
+    section_title(slide, "Project Overview")
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+
+    # Description
+    add_text(slide, desc, Inches(0.6), Inches(1.9), Inches(6.2), Inches(1.2),
+             font_size=Pt(12), color=RGBColor(0xBB, 0xBB, 0xBB), fit=True)
+
+    # Bullet points
+    for b, cell in zip(bullets, layout("overview.bullets", len(bullets))):
+        add_text(slide, b, *cell.text,
+                 font_size=Pt(11), color=RGBColor(0xCC, 0xCC, 0xCC))
+
+    # Right column — info cards
+    for (label, val), cell in zip(info, layout("overview.info", len(info))):
+        add_rect(slide, *cell.card, **STYLES["card"])
+        add_text(slide, label, *cell.label,
+                 **STYLES["gold_label"])
+        add_text(slide, val, *cell.value,
+                 font_size=Pt(14), color=WHITE, bold=True)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 3 — Tech Stack
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("tech_stack", cacheable=True)
+def build_tech_stack(slide, tech):
+    fill_bg(slide, DARK)
+    slide_number_label(slide, 3, "Technology")
+    section_title(slide, "Tech Stack")
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+
+    for (name, desc), cell in zip(tech, layout("tech_stack.cards", len(tech))):
+        add_rect(slide, *cell.card, **STYLES["card"])
+        add_text(slide, name, *cell.name,
+                 font_size=Pt(12), bold=True, color=GOLD_LIGHT)
+        add_text(slide, desc, *cell.desc,
+                 font_size=Pt(10), color=MUTED, fit=True)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDES 4–10 — Screenshot slides
+# ══════════════════════════════════════════════════════════════════════════════
+def panel_slide(slide, label, title, bullets, img_path):
+    """Dark left panel with label, title and bullets; picture on the right."""
+    fill_bg(slide, DARK)
+
+    # Left panel background
+    add_rect(slide, 0, 0, Inches(5.5), H, fill_color=DARK2)
+
+    # Slide number label
+    slide_label(slide, label)
+
+    # Title
+    add_text(slide, title, Inches(0.5), Inches(0.75), Inches(4.8), Inches(1.0),
+             font_size=Pt(32), bold=True, color=WHITE, font_name="Georgia")
+
+    # Gold line
+    add_gold_line(slide, Inches(0.5), Inches(1.8))
+
+    # Bullets
+    for b, cell in zip(bullets, layout("panel.bullets", len(bullets))):
+        add_text(slide, f"◆  {b}", *cell.text,
+                 font_size=Pt(11), color=RGBColor(0xCC, 0xCC, 0xCC), fit=True)
+
+    # Screenshot on right
+    if img_path:
+        add_picture(slide, img_path, *layout("panel.picture", 1)[0].picture)
+
+@slide_builder("screenshots")
+def build_screenshot(slide, screenshots, item):
+    slide_num, title, key, bullets = item
+    panel_slide(slide, f"{slide_num:02d}  —  {title.upper()}", title, bullets,
+                screenshots.get(key))
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CATALOGUE — one slide per product
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("products")
+def build_product(slide, item):
+    """``item``: mapping with ``sku``, ``name`` and optional ``category``,
+    ``price``, ``details`` (list of strings) and ``image`` (path)."""
+    details = list(item.get("details", ()))
+    if item.get("price") is not None:
+        details.append(f"Price  ₹{item['price']:,}")
+    label = f"{item['sku']}  —  {item.get('category', 'Catalogue').upper()}"
+    panel_slide(slide, label, item["name"], details, item.get("image"))
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 11 — Backend Architecture
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("architecture", cacheable=True)
+def build_architecture(slide, fe_items, be_items, arch_stats):
+    fill_bg(slide, DARK2)
+    slide_number_label(slide, 11, "Architecture")
+    section_title(slide, "Backend Architecture")
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+
+    # Frontend box
+    add_rect(slide, Inches(0.4), Inches(2.0), Inches(4.0), Inches(4.0), **STYLES["card"])
+    add_text(slide, "🖥️  Frontend (React)", Inches(0.55), Inches(2.1), Inches(3.7), Inches(0.5),
+             font_size=Pt(14), bold=True, color=GOLD_LIGHT)
+    for item, cell in zip(fe_items, layout("architecture.fe_items", len(fe_items))):
+        add_text(slide, f"▸  {item}", *cell.text,
+                 font_size=Pt(10), color=RGBColor(0xBB, 0xBB, 0xBB))
+
+    # Arrow
+    add_text(slide, "REST API\n──────────\nHTTP / JSON\nBearer Token",
+             Inches(4.55), Inches(3.3), Inches(1.5), Inches(1.2),
+             font_size=Pt(10), color=GOLD, align=PP_ALIGN.CENTER)
+
+    # Backend box
+    add_rect(slide, Inches(6.1), Inches(2.0), Inches(4.0), Inches(4.0), **STYLES["card"])
+    add_text(slide, "⚙️  Backend (Node.js)", Inches(6.25), Inches(2.1), Inches(3.7), Inches(0.5),
+             font_size=Pt(14), bold=True, color=GOLD_LIGHT)
+    for item, cell in zip(be_items, layout("architecture.be_items", len(be_items))):
+        add_text(slide, f"▸  {item}", *cell.text,
+                 font_size=Pt(10), color=RGBColor(0xBB, 0xBB, 0xBB))
+
+    # Stats bar
+    add_rect(slide, Inches(0.4), Inches(6.2), Inches(12.5), Inches(0.9), **STYLES["card"])
+    for (lbl, val), cell in zip(arch_stats, layout("architecture.stats", len(arch_stats))):
+        add_text(slide, lbl, *cell.label,
+                 **STYLES["gold_label"])
+        add_text(slide, val, *cell.value,
+                 font_size=Pt(13), color=WHITE, bold=True)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 12 — Database Schema
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("schema", cacheable=True)
+def build_schema(slide, schemas):
+    fill_bg(slide, DARK2)
+    slide_number_label(slide, 12, "Database")
+    section_title(slide, "MongoDB Schema Design")
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+
+    for (title, fields), column in zip(schemas, layout("schema.columns", len(schemas))):
+        # Header
+        add_rect(slide, *column.header, fill_color=GOLD)
+        add_text(slide, title, *column.title,
+                 font_size=Pt(12), bold=True, color=DARK)
+        # Body
+        add_rect(slide, *column.body, **STYLES["card"])
+        for (fname, ftype), cell in zip(fields, layout("schema.fields", len(fields), column.body.left)):
+            add_text(slide, fname, *cell.name,
+                     font_size=Pt(10), color=WHITE)
+            add_text(slide, ftype, *cell.type,
+                     font_size=Pt(9), color=GOLD, align=PP_ALIGN.RIGHT)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 13 — Key Features
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("features")
+def build_features(slide, features):
+    fill_bg(slide, DARK)
+    slide_number_label(slide, 13, "Features")
+    section_title(slide, "Key Features Summary")
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+
+    for (icon, name, desc), cell in zip(features, layout("features.cards", len(features))):
+        add_rect(slide, *cell.card, **STYLES["card"])
+        add_text(slide, icon, *cell.icon,
+                 font_size=Pt(24), align=PP_ALIGN.CENTER)
+        add_text(slide, name, *cell.name,
+                 font_size=Pt(12), bold=True, color=GOLD_LIGHT, align=PP_ALIGN.CENTER)
+        add_text(slide, desc, *cell.desc,
+                 font_size=Pt(9), color=MUTED, align=PP_ALIGN.CENTER, fit=True)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 14 — Challenges & Solutions
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("challenges")
+def build_challenges(slide, challenges):
+    fill_bg(slide, DARK2)
+    slide_number_label(slide, 14, "Challenges")
+    section_title(slide, "Challenges & Solutions")
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+
+    for (challenge, solution), cell in zip(challenges, layout("challenges.rows", len(challenges))):
+        # Challenge box
+        add_rect(slide, *cell.challenge,
+                 fill_color=DARK3, line_color=RED)
+        add_text(slide, "CHALLENGE", *cell.challenge_label,
+                 font_size=Pt(8), bold=True, color=RED)
+        add_text(slide, challenge, *cell.challenge_text,
+                 font_size=Pt(10), color=RGBColor(0xCC, 0xCC, 0xCC), fit=True)
+        # Arrow
+        add_text(slide, "→", *cell.arrow,
+                 font_size=Pt(22), color=GOLD, align=PP_ALIGN.CENTER)
+        # Solution box
+        add_rect(slide, *cell.solution,
+                 fill_color=DARK3, line_color=GOLD)
+        add_text(slide, "SOLUTION", *cell.solution_label,
+                 font_size=Pt(8), bold=True, color=GOLD)
+        add_text(slide, solution, *cell.solution_text,
+                 font_size=Pt(10), color=RGBColor(0xCC, 0xCC, 0xCC), fit=True)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SLIDE 15 — Thank You
+# ══════════════════════════════════════════════════════════════════════════════
+@slide_builder("thank_you")
+def build_thank_you(slide, contacts):
+    fill_bg(slide, DARK)
+
+    # Glow
+    add_rect(slide, Inches(2), Inches(1), Inches(9.33), Inches(5.5),
+             fill_color=RGBColor(0x1A, 0x12, 0x00))
+
+    add_text(slide, "💎", Inches(5.5), Inches(0.8), Inches(2.33), Inches(0.9),
+             font_size=Pt(44), align=PP_ALIGN.CENTER, color=WHITE)
+
+    add_text(slide, "Thank You",
+             Inches(1), Inches(1.7), Inches(11.33), Inches(1.4),
+             font_size=Pt(64), bold=True, color=GOLD_LIGHT,
+             align=PP_ALIGN.CENTER, font_name="Georgia")
+
+    add_text(slide, "Questions & Discussion",
+             Inches(1), Inches(3.1), Inches(11.33), Inches(0.5),
+             font_size=Pt(16), color=MUTED, align=PP_ALIGN.CENTER)
+
+    add_gold_line(slide, Inches(6.1), Inches(3.7), Inches(1.1))
+
+    add_text(slide, "Fine Jewellery's  —  A Full-Stack Luxury E-Commerce Platform",
+             Inches(1), Inches(4.0), Inches(11.33), Inches(0.4),
+             font_size=Pt(11), color=MUTED, align=PP_ALIGN.CENTER)
+
+    # Contact cards
+    for (icon, lbl, val), cell in zip(contacts, layout("thank_you.contacts", len(contacts))):
+        add_rect(slide, *cell.card, **STYLES["card"])
+        add_text(slide, icon, *cell.icon,
+                 font_size=Pt(20), align=PP_ALIGN.CENTER)
+        add_text(slide, lbl, *cell.label,
+                 font_size=Pt(8), color=MUTED, align=PP_ALIGN.CENTER)
+        add_text(slide, val, *cell.value,
+                 font_size=Pt(12), bold=True, color=GOLD_LIGHT, align=PP_ALIGN.CENTER)
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SALES — analytics of an order export (see deck_sales)
+# ══════════════════════════════════════════════════════════════════════════════
+MONEY_FORMAT = '"₹"#,##0'
+
+def _money(value):
+    return f"₹{value:,.0f}"
+
+def _sales_header(slide, label, title, report):
+    slide_label(slide, f"SALES  —  {label.upper()}")
+    section_title(slide, title)
+    add_gold_line(slide, Inches(0.6), Inches(1.65))
+    if report.first_day:
+        add_text(slide, f"{report.first_day}  –  {report.last_day}", Inches(7.3), Inches(0.35),
+                 Inches(5.4), Inches(0.3), font_size=Pt(9), color=MUTED, align=PP_ALIGN.RIGHT)
+
+@slide_builder("sales_summary")
+def build_sales_summary(slide, orders):
+    report = sales_report(orders)
+    fill_bg(slide, DARK)
+    _sales_header(slide, "Summary", "Sales Summary", report)
+
+    stats = [(_money(report.revenue), "REVENUE"), (f"{report.orders:,}", "ORDERS"),
+             (_money(report.revenue / report.orders if report.orders else 0), "AVERAGE ORDER"),
+             (f"{report.units:,}", "UNITS SOLD")]
+    for (value, lbl), cell in zip(stats, layout("sales.stats", len(stats))):
+        add_rect(slide, *cell.card, **STYLES["card"])
+        add_text(slide, value, *cell.value,
+                 font_size=Pt(26), bold=True, color=GOLD_LIGHT, font_name="Georgia", fit=True)
+        add_text(slide, lbl, *cell.label,
+                 **STYLES["gold_label"])
+
+    rows = [("Status", "Orders", "Revenue")]
+    rows += [(status.title(), f"{count:,}", _money(revenue)) for status, count, revenue in report.by_status]
+    add_table(slide, rows[:9], Inches(0.6), Inches(3.7), Inches(12.1), Inches(0.36) * len(rows[:9]),
+              widths=(2, 1, 1), right=(1, 2))
+
+@slide_builder("sales_breakdown")
+def build_sales_breakdown(slide, orders):
+    report = sales_report(orders)
+    fill_bg(slide, DARK2)
+    _sales_header(slide, "Breakdown", "Revenue by Category & Region", report)
+
+    charts = [("REVENUE BY CATEGORY", report.by_category), ("REVENUE BY REGION", report.by_region)]
+    for (lbl, groups), cell in zip(charts, layout("sales.charts", len(charts))):
+        add_text(slide, lbl, *cell.label,
+                 **STYLES["gold_label"])
+        if groups:
+            add_chart(slide, "bar", [g for g, _ in groups], [("Revenue", [r for _, r in groups])],
+                      *cell.chart, number_format=MONEY_FORMAT)
+
+@slide_builder("sales_products")
+def build_sales_products(slide, orders):
+    report = sales_report(orders)
+    fill_bg(slide, DARK)
+    _sales_header(slide, "Products", "Top Products", report)
+
+    rows = [("#", "SKU", "Product", "Units", "Revenue")]
+    rows += [(n, sku, name, f"{units:,}", _money(revenue))
+             for n, (sku, name, units, revenue) in enumerate(report.top_skus, 1)]
+    add_table(slide, rows, Inches(0.6), Inches(2.0), Inches(12.1), Inches(0.42) * len(rows),
+              font_size=Pt(11), widths=(0.4, 2, 4, 1, 1.4), right=(3, 4))
+
+@slide_builder("sales_trend")
+def build_sales_trend(slide, orders):
+    report = sales_report(orders)
+    fill_bg(slide, DARK2)
+    _sales_header(slide, "Trend", "Revenue Trend", report)
+
+    points = trend(report)
+    if points:
+        add_chart(slide, "line", [day for day, _ in points], [("Revenue", [r for _, r in points])],
+                  Inches(0.6), Inches(2.0), Inches(12.1), Inches(5.1), number_format=MONEY_FORMAT)
+
+# ── Slide model ────────────────────────────────────────────────────────────
+# The helpers above record into a ``deck_model.SlideModel`` when given one
+# instead of a slide, so every builder can also describe its slide.
+_DRAW = {Rect: lambda slide, s: add_rect(slide, *s),
+         Text: lambda slide, s: add_text(slide, *s),
+         Picture: lambda slide, s: add_picture(slide, *s),
+         Table: lambda slide, s: add_table(slide, *s),
+         Chart: lambda slide, s: add_chart(slide, *s)}
+
+def model_slide(name, data):
+    """The ``SlideModel`` of plan entry ``(name, data)``."""
+    model = SlideModel()
+    SLIDE_BUILDERS[name].fn(model, **data)
+    return model
+
+def draw_model(slide, model):
+    """Draw ``model`` onto python-pptx ``slide``; the result is the same
+    slide the builder would have drawn directly."""
+    if model.background is not None:
+        fill_bg(slide, model.background)
+    for shape in model.shapes:
+        _DRAW[type(shape)](slide, shape)
+    return slide
+
+# ── Build ──────────────────────────────────────────────────────────────────
+# Finished slides of cacheable sections, shared by every deck this process
+# (and, through the disk cache, this machine) builds; None disables it.
+SLIDE_CACHE = SlideCache()
+
+def render_slides(prs, plan, previous=None, fingerprints=None):
+    """Build every ``(name, data)`` of ``plan`` onto a new blank slide of
+    ``prs``, yielding each finished slide.
+
+    With ``previous`` (a ``PreviousBuild``) each slide is fingerprinted
+    into ``fingerprints`` and, when unchanged, grafted instead of built.
+    Slides of cacheable sections are grafted from, or stored to, the
+    cross-deck ``SLIDE_CACHE``.  Fingerprints cover the drawing code,
+    ``AUTO_FIT`` and the font files text is measured with, since fitted
+    text sizes depend on both.
+    """
+    version = None
+    for name, data in plan:
+        slide = blank_slide(prs)
+        builder = SLIDE_BUILDERS[name]
+        cache = SLIDE_CACHE if builder.cacheable else None
+        fp = None
+        if previous is not None or cache is not None:
+            if version is None:
+                version = [code_version(), AUTO_FIT, metrics_source()]
+            fp = slide_fingerprint(name, data, version)
+        if previous is not None:
+            fingerprints.append(fp)
+        snapshot = previous.get(fp) if previous is not None else None
+        if snapshot is None and cache is not None:
+            snapshot = cache.get(fp)
+        if snapshot is not None:
+            graft_slide(slide, snapshot)
+            yield slide
+            continue
+        builder.fn(slide, **data)
+        if cache is not None:
+            cache.put(fp, snapshot_slide(slide))
+        yield slide
+
+def _plan(spec):
+    if isinstance(spec, (str, os.PathLike)):
+        from deck_spec import load_plan
+        return load_plan(spec)
+    return plan_deck(dict(DEFAULT_SPEC, **(spec or {})))
+
+def _pictures(entry):
+    return slide_pictures(*entry)
+
+def build_deck(spec=None, output=OUTPUT, incremental=False, compresslevel=COMPRESSLEVEL):
+    """Build one deck from ``spec`` (overrides merged onto ``DEFAULT_SPEC``,
+    or the path of a spec file, see ``deck_spec``) and save it to
+    ``output`` — a path or any writable binary stream — with parts
+    serialized in parallel at deflate level ``compresslevel`` (see
+    ``deck_package.save_presentation``).  Returns the ``Presentation``.
+
+    With ``incremental=True`` each slide is fingerprinted (builder, data,
+    referenced image files, builder code) and any slide whose fingerprint
+    matches the previous build of ``output`` (a path, then) is grafted from
+    that file instead of being rebuilt.
+
+    Every picture the spec references is checked up front (missing ones
+    are reported together in one ``MissingImagesWarning``) and read on a
+    ``deck_images.Prefetcher`` a few slides ahead of the builder.
+    """
+    if incremental and not isinstance(output, (str, os.PathLike)):
+        raise ValueError("incremental builds need an output path to compare against")
+    prs = new_presentation()
+    previous = PreviousBuild(output) if incremental else None
+    fingerprints = []
+    plan = list(_plan(spec))
+    with Prefetcher() as prefetcher:
+        warn_missing(prefetcher.check(path for entry in plan for path, _ in _pictures(entry)))
+        for _ in render_slides(prs, prefetcher.ahead(plan, _pictures), previous, fingerprints):
+            pass
+    save_presentation(prs, output, compresslevel=compresslevel)
+    if incremental:
+        write_sidecar(output, fingerprints)
+    return prs
+
+def build_catalogue(spec=None, output=OUTPUT, compresslevel=COMPRESSLEVEL):
+    """Build a deck slide by slide, streaming each finished slide part to
+    ``output`` instead of holding the whole ``Presentation``; returns the
+    slide count.  Intended for catalogue specs whose ``products`` is a
+    (possibly lazy) iterable of thousands of items — peak memory stays
+    flat as the slide count grows — and for stream outputs (a socket, an
+    HTTP response, stdout): the stream is flushed after every slide, so
+    the reader receives the deck while it is being built.
+
+    Pictures are prefetched as for ``build_deck``; as the plan is never
+    held whole, missing files are reported in one warning at the end.
+    """
+    scratch = new_presentation()
+    with PackageWriter(scratch, output, compresslevel=compresslevel) as writer, \
+            Prefetcher() as prefetcher:
+        for slide in render_slides(scratch, prefetcher.ahead(_plan(spec), _pictures)):
+            writer.add_slide(slide)
+            drop_slide(scratch, slide)
+    warn_missing(list(prefetcher.missing))
+    return writer.slide_count
+
+# ── Batch ──────────────────────────────────────────────────────────────────
+def _failed(job, error, seconds=0.0):
+    return {"output": job.get("output"), "ok": False, "slides": 0, "seconds": seconds, "error": error}
+
+def _build_job(job):
+    """Worker entry point: build one manifest entry, never raise."""
+    start = time.perf_counter()
+    try:
+        prs = build_deck(job.get("spec"), job["output"])
+    except Exception:
+        return _failed(job, traceback.format_exc(), time.perf_counter() - start)
+    return {"output": job["output"], "ok": True, "slides": len(prs.slides),
+            "seconds": time.perf_counter() - start, "error": None}
+
+def _run_jobs(jobs, workers):
+    """Build ``{index: job}`` on a fresh pool.  Returns ``(results by index,
+    indices left unfinished because a worker died and broke the pool)``."""
+    results, unfinished, futures = {}, [], {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for i, job in jobs.items():
+            try:
+                futures[i] = pool.submit(_build_job, job)
+            except BrokenProcessPool:           # a worker died while we were still submitting
+                unfinished += [j for j in jobs if j not in futures]
+                break
+        for i, future in futures.items():
+            try:
+                results[i] = future.result()
+            except BrokenProcessPool:
+                unfinished.append(i)
+            except Exception as exc:
+                results[i] = _failed(jobs[i], repr(exc))
+    return results, sorted(unfinished)
+
+def build_batch(manifest, workers=None):
+    """Build every ``{"output": path, "spec": {...}}`` entry of ``manifest``
+    across a process pool of ``workers`` processes (default: CPU count).
+
+    Returns one result dict per entry, in manifest order, with ``ok``,
+    ``slides``, ``seconds`` and ``error`` (a traceback string on failure).
+    A failing spec only fails its own entry.  A worker that dies outright
+    breaks the whole pool; the entries it left unfinished are resubmitted
+    to a new one, and when a round finishes none of them the first is run
+    alone — an entry that kills a pool of its own is the only one failed.
+    """
+    results = {}
+    pending = dict(enumerate(manifest))
+    while pending:
+        done, unfinished = _run_jobs(pending, workers)
+        results.update(done)
+        if unfinished and not done:
+            first = unfinished[0]
+            alone, crashed = _run_jobs({first: manifest[first]}, 1)
+            results.update(alone)
+            if crashed:
+                results[first] = _failed(manifest[first], "worker process died building this entry")
+        pending = {i: manifest[i] for i in unfinished if i not in results}
+    return [results[i] for i in range(len(manifest))]
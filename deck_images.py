@@ -0,0 +1,248 @@
+"""
+Fine Jewellery's — screenshot preprocessing for the PowerPoint generator.
+
+Pictures are drawn into fixed boxes, so embedding full-resolution PNGs only
+bloats the .pptx.  ``prepare_image`` downsamples an image to the pixel size
+of its placement box at ``IMAGE_DPI``, re-encodes it as JPEG (opaque images)
+or optimised PNG — whichever is smaller — and stores the result in an
+on-disk cache keyed by source content hash plus target size.  Repeat builds
+only hash the source bytes and reuse the cached file.
+
+On top of that, ``load_image`` keeps prepared bytes in a size-bounded
+in-process LRU shared by every deck a worker builds, and ``image_part``
+keeps one content-addressed image part per package, so each unique image
+is embedded exactly once and every slide showing it points at that part.
+
+A ``Prefetcher`` takes source reads and image preparation off the build's
+critical path: a bounded thread pool reads and prepares the pictures of
+the next slides while the current one is built, and ``load_image`` hands
+the builder the finished buffer (waiting for it if it is still in
+flight).  Missing files are found by stat'ing every referenced path in
+parallel, so a build can report them all at once.
+"""
+
+import hashlib
+import io
+import os
+import threading
+import warnings
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from deck_content import CACHE_DIR, write_atomic
+
+IMAGE_DPI = 150
+JPEG_QUALITY = 85
+LRU_BYTES = 256 * 1024 * 1024
+PREFETCH_WORKERS = 8          # reads are I/O bound: threads, not processes
+PREFETCH_AHEAD = 32           # slides whose pictures are read ahead of the builder
+
+EMU_PER_INCH = 914400
+
+def target_pixels(width, height, dpi=IMAGE_DPI):
+    """Pixel size of a ``width`` x ``height`` EMU box at ``dpi``."""
+    return (max(1, round(width * dpi / EMU_PER_INCH)),
+            max(1, round(height * dpi / EMU_PER_INCH)))
+
+def _encode(img):
+    """Return ``(ext, bytes)`` of the smaller of JPEG / optimised PNG."""
+    candidates = []
+    png = io.BytesIO()
+    img.save(png, "PNG", optimize=True)
+    candidates.append(("png", png.getvalue()))
+    if img.mode in ("RGB", "L"):
+        jpg = io.BytesIO()
+        img.save(jpg, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        candidates.append(("jpg", jpg.getvalue()))
+    return min(candidates, key=lambda c: len(c[1]))
+
+def _resample(data, size):
+    """Decode ``data`` and shrink it to at most ``size`` (never upscale).
+    Returns ``(image, source format, resized)``."""
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    fmt = img.format
+    if img.mode not in ("RGB", "RGBA", "L", "LA"):
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    if img.mode in ("RGBA", "LA") and img.getchannel("A").getextrema()[0] == 255:
+        img = img.convert("RGB" if img.mode == "RGBA" else "L")
+    size = (min(size[0], img.width), min(size[1], img.height))
+    if size == img.size:
+        return img, fmt, False
+    return img.resize(size, Image.LANCZOS), fmt, True
+
+def prepare_image(path, width, height, dpi=IMAGE_DPI, cache_dir=None):
+    """Return the path of a cached, downsampled copy of ``path`` sized for a
+    ``width`` x ``height`` EMU placement box."""
+    cache_dir = os.path.join(cache_dir or CACHE_DIR, "images")
+    with open(path, "rb") as f:
+        data = f.read()
+    size = target_pixels(width, height, dpi)
+    key = f"{hashlib.sha256(data).hexdigest()}-{size[0]}x{size[1]}"
+    for ext in ("jpg", "png"):
+        cached = os.path.join(cache_dir, f"{key}.{ext}")
+        if os.path.exists(cached):
+            return cached
+
+    img, fmt, resized = _resample(data, size)
+    ext, encoded = _encode(img)
+    if not resized and fmt in ("PNG", "JPEG") and len(data) <= len(encoded):
+        # Already small enough and better compressed than our re-encode.
+        ext, encoded = ("png" if fmt == "PNG" else "jpg"), data
+    os.makedirs(cache_dir, exist_ok=True)
+    cached = os.path.join(cache_dir, f"{key}.{ext}")
+    write_atomic(cached, encoded)
+    return cached
+
+# ── In-process LRU ─────────────────────────────────────────────────────────
+class _BytesLRU:
+    """Least-recently-used mapping bounded by the total size of its values."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+
+    def get(self, key):
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        if key in self._items:
+            return
+        self._items[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes and len(self._items) > 1:
+            _, old = self._items.popitem(last=False)
+            self.size -= len(old)
+
+_lru = _BytesLRU(LRU_BYTES)
+_lock = threading.Lock()      # guards _lru and _pending across prefetch threads
+_pending = {}                 # (abspath, pixels) -> Future of a prefetched blob
+
+def _load(path, width, height, dpi=IMAGE_DPI):
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size, target_pixels(width, height, dpi))
+    with _lock:
+        blob = _lru.get(key)
+    if blob is None:
+        with open(prepare_image(path, width, height, dpi), "rb") as f:
+            blob = f.read()
+        with _lock:
+            _lru.put(key, blob)
+    return blob
+
+def load_image(path, width, height, dpi=IMAGE_DPI):
+    """Return the prepared bytes of ``path`` for a ``width`` x ``height`` box,
+    or None when the file does not exist.  Hits are keyed by file stat, so
+    they never touch the source file; a prefetched image — or a file its
+    ``Prefetcher`` found missing — is taken from it without a stat."""
+    future = None
+    if _pending:
+        with _lock:
+            future = _pending.pop((os.path.abspath(path), target_pixels(width, height, dpi)), None)
+    if future is not None:
+        return future.result()
+    try:
+        return _load(path, width, height, dpi)
+    except FileNotFoundError:
+        return None
+
+# ── Prefetch ───────────────────────────────────────────────────────────────
+class MissingImagesWarning(UserWarning):
+    """Pictures referenced by a spec whose files do not exist; their slides
+    are built without them."""
+
+def warn_missing(paths):
+    """Report every path of ``paths`` in a single warning."""
+    if paths:
+        listing = "\n  ".join(paths)
+        warnings.warn(f"{len(paths)} image file(s) not found, left out of the deck:\n  {listing}",
+                      MissingImagesWarning, stacklevel=3)
+
+class Prefetcher:
+    """Reads and prepares pictures on a pool of ``workers`` threads ahead
+    of the slide builder.  Use as a context manager; results not picked up
+    by ``load_image`` are dropped on exit."""
+
+    def __init__(self, workers=PREFETCH_WORKERS):
+        self.missing = {}                 # paths found missing, in order met
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="deck-image")
+        self._keys = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with _lock:
+            for key in self._keys:
+                _pending.pop(key, None)
+        self._keys.clear()
+        self._pool.shutdown(cancel_futures=True)
+
+    def check(self, paths):
+        """Stat ``paths`` in parallel; return (and remember) the missing ones."""
+        paths = list(dict.fromkeys(p for p in paths if p))
+        found = [p for p, ok in zip(paths, self._pool.map(os.path.isfile, paths)) if not ok]
+        self.missing.update(dict.fromkeys(found))
+        return found
+
+    def _fetch(self, path, width, height):
+        if path in self.missing:
+            return None
+        try:
+            return _load(path, width, height)
+        except FileNotFoundError:
+            self.missing[path] = None
+            return None
+
+    def fetch(self, path, width, height):
+        """Start preparing ``path`` for a ``width`` x ``height`` box."""
+        key = (os.path.abspath(path), target_pixels(width, height))
+        with _lock:
+            if key not in _pending:
+                _pending[key] = self._pool.submit(self._fetch, path, width, height)
+                self._keys.add(key)
+
+    def ahead(self, entries, pictures, window=PREFETCH_AHEAD):
+        """Yield ``entries`` unchanged, in order, after fetching the
+        ``pictures(entry)`` — ``(path, box)`` pairs — of the next ``window``
+        entries.  ``entries`` is consumed lazily."""
+        queue = deque()
+        for entry in entries:
+            for path, box in pictures(entry):
+                self.fetch(path, box.width, box.height)
+            queue.append(entry)
+            if len(queue) > window:
+                yield queue.popleft()
+        while queue:
+            yield queue.popleft()
+
+# ── Content-addressed image parts ──────────────────────────────────────────
+# package -> {sha1: ImagePart}.  Values are weak so parts of slides dropped
+# by the streaming writer are not kept alive.
+_parts = weakref.WeakKeyDictionary()
+
+def image_part(slide, blob):
+    """Return ``(image_part, rId)`` relating ``slide`` to the one image part
+    of its package holding ``blob``."""
+    package = slide.part.package
+    store = _parts.get(package)
+    if store is None:
+        store = _parts[package] = weakref.WeakValueDictionary()
+    sha1 = hashlib.sha1(blob).hexdigest()
+    part = store.get(sha1)
+    if part is None:
+        part, rId = slide.part.get_or_add_image_part(io.BytesIO(blob))
+        store[sha1] = part
+        return part, rId
+    return part, slide.part.relate_to(part, RT.IMAGE)
@@ -0,0 +1,202 @@
+"""
+Fine Jewellery's — slide layout templates.
+
+Every repeated block of a slide (a card grid, a bullet list, a row of
+stats) is described once here: where its first cell sits, the pitch
+between cells and the boxes inside a cell.  ``layout(name, count)``
+resolves a template for ``count`` items to absolute EMU boxes and caches
+the result, so a builder looks its boxes up instead of redoing the
+``Inches(origin + i * pitch)`` arithmetic for every shape of every slide.
+
+Because the geometry is data, ``overflow`` and ``check_plan`` can tell —
+without drawing anything — when a section's items will run off the slide.
+
+Standard library only.  Positions round exactly like ``pptx.util.Inches``
+and ``Pt``, so builders produce the same shapes as the inline maths did.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+EMU_PER_INCH = 914400
+EMU_PER_PT = 12700
+
+def inches(n):
+    return int(n * EMU_PER_INCH)
+
+def pt(n):
+    return int(n * EMU_PER_PT)
+
+Box = namedtuple("Box", "left top width height")
+
+SLIDE = Box(0, 0, inches(13.33), inches(7.5))
+
+# ── Templates ──────────────────────────────────────────────────────────────
+# Cell ``i`` of a template sits at (left + col * dx, top + row * dy) inches,
+# with ``cols`` cells per row (None: a single row).  ``parts`` are the boxes
+# drawn in every cell, as EMU offsets from the cell origin plus EMU sizes; a
+# coordinate that does not move from cell to cell is given absolutely, with
+# the template origin left at 0 on that axis.  A cell overflows when any
+# part leaves ``bounds``.
+Template = namedtuple("Template", "cols left top dx dy parts bounds")
+
+def grid(cols, left=0.0, top=0.0, dx=0.0, dy=0.0, bounds=SLIDE, **parts):
+    return Template(cols, left, top, dx, dy, parts, bounds)
+
+def row(left, dx, bounds=SLIDE, **parts):
+    return grid(None, left=left, dx=dx, bounds=bounds, **parts)
+
+def stack(top, dy, bounds=SLIDE, **parts):
+    return grid(1, top=top, dy=dy, bounds=bounds, **parts)
+
+def two_column(top, dy, lefts, size, bounds=SLIDE):
+    """Two stacks of single-box items sharing rows, one per entry of ``lefts``."""
+    return tuple(stack(top, dy, bounds, text=(left, 0) + size) for left in lefts)
+
+FE_ITEMS, BE_ITEMS = two_column(2.65, 0.47, (inches(0.6), inches(6.3)), (inches(3.6), inches(0.4)),
+                                bounds=Box(0, 0, SLIDE.width, inches(6.0)))
+
+TEMPLATES = {
+    "title.stats": row(2.5, 2.1,
+                       num=(0, inches(4.1), inches(1.8), inches(0.6)),
+                       label=(0, inches(4.65), inches(1.8), inches(0.3))),
+    "overview.bullets": stack(3.15, 0.42, text=(inches(0.6), 0, inches(6.2), inches(0.4))),
+    "overview.info": stack(1.9, 1.3,
+                           card=(inches(7.2), 0, inches(5.5), inches(1.1)),
+                           label=(inches(7.4), pt(8), inches(5), inches(0.3)),
+                           value=(inches(7.4), inches(0.4), inches(5), inches(0.5))),
+    "tech_stack.cards": grid(3, 0.5, 2.0, 4.27, 1.6,
+                             card=(0, 0, inches(4.0), inches(1.4)),
+                             name=(inches(0.15), inches(0.1), inches(3.7), inches(0.45)),
+                             desc=(inches(0.15), inches(0.55), inches(3.7), inches(0.7))),
+    "panel.bullets": stack(2.1, 0.72, text=(inches(0.5), 0, inches(4.8), inches(0.6))),
+    "panel.picture": grid(1, picture=(inches(5.6), inches(0.1), inches(7.6), inches(7.3))),
+    "architecture.fe_items": FE_ITEMS,
+    "architecture.be_items": BE_ITEMS,
+    "architecture.stats": row(1.2, 3.1,
+                              label=(0, inches(6.25), inches(2.8), inches(0.3)),
+                              value=(0, inches(6.6), inches(2.8), inches(0.4))),
+    "schema.columns": row(0.4, 4.3,
+                          header=(0, inches(2.0), inches(4.0), inches(0.5)),
+                          title=(inches(0.1), inches(2.05), inches(3.8), inches(0.4)),
+                          body=(0, inches(2.5), inches(4.0), inches(4.5))),
+    # drawn inside a schema column: layout("schema.fields", n, at=column.left)
+    "schema.fields": stack(2.6, 0.47, bounds=Box(0, 0, SLIDE.width, inches(2.5) + inches(4.5)),
+                           name=(inches(0.15), 0, inches(2.2), inches(0.4)),
+                           type=(inches(2.4), 0, inches(1.5), inches(0.4))),
+    "features.cards": grid(4, 0.4, 2.0, 3.2, 2.4,
+                           card=(0, 0, inches(3.0), inches(2.1)),
+                           icon=(inches(0.1), inches(0.1), inches(2.8), inches(0.55)),
+                           name=(inches(0.1), inches(0.7), inches(2.8), inches(0.4)),
+                           desc=(inches(0.1), inches(1.1), inches(2.8), inches(0.85))),
+    "challenges.rows": stack(2.0, 1.65,
+                             challenge=(inches(0.4), 0, inches(5.5), inches(1.4)),
+                             challenge_label=(inches(0.55), inches(0.08), inches(5), inches(0.3)),
+                             challenge_text=(inches(0.55), inches(0.4), inches(5.2), inches(0.9)),
+                             arrow=(inches(6.05), inches(0.5), inches(0.6), inches(0.5)),
+                             solution=(inches(6.8), 0, inches(6.1), inches(1.4)),
+                             solution_label=(inches(6.95), inches(0.08), inches(5.8), inches(0.3)),
+                             solution_text=(inches(6.95), inches(0.4), inches(5.8), inches(0.9))),
+    "sales.stats": row(0.6, 3.1,
+                       card=(0, inches(2.0), inches(2.9), inches(1.3)),
+                       value=(inches(0.15), inches(2.15), inches(2.6), inches(0.6)),
+                       label=(inches(0.15), inches(2.8), inches(2.6), inches(0.3))),
+    "sales.charts": row(0.6, 6.2,
+                        label=(0, inches(1.95), inches(5.9), inches(0.3)),
+                        chart=(0, inches(2.3), inches(5.9), inches(4.8))),
+    "thank_you.contacts": row(1.2, 2.8,
+                              card=(0, inches(4.6), inches(2.5), inches(1.5)),
+                              icon=(0, inches(4.65), inches(2.5), inches(0.5)),
+                              label=(0, inches(5.15), inches(2.5), inches(0.3)),
+                              value=(0, inches(5.45), inches(2.5), inches(0.4))),
+}
+
+_cell_types = {}
+
+def _cell_type(name):
+    cell = _cell_types.get(name)
+    if cell is None:
+        cell = _cell_types[name] = namedtuple("Cell", TEMPLATES[name].parts)
+    return cell
+
+def _origin(t, i):
+    col, r = (i, 0) if t.cols is None else (i % t.cols, i // t.cols)
+    return int((t.left + col * t.dx) * EMU_PER_INCH), int((t.top + r * t.dy) * EMU_PER_INCH)
+
+# ── Lookup ─────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def layout(name, count, at=0):
+    """Boxes of ``count`` cells of template ``name``, shifted right by ``at``
+    EMU: a tuple of cells whose fields are the template's parts (``Box``)."""
+    t = TEMPLATES[name]
+    cell = _cell_type(name)
+    cells = []
+    for i in range(count):
+        x, y = _origin(t, i)
+        cells.append(cell(*(Box(x + ox + at, y + oy, w, h) for ox, oy, w, h in t.parts.values())))
+    return tuple(cells)
+
+def _outside(box, bounds):
+    return (box.left < bounds.left or box.top < bounds.top
+            or box.left + box.width > bounds.left + bounds.width
+            or box.top + box.height > bounds.top + bounds.height)
+
+def overflow(name, count, at=0):
+    """How many of ``count`` items of template ``name`` fall outside its bounds."""
+    bounds = TEMPLATES[name].bounds
+    return sum(1 for cell in layout(name, count, at) if any(_outside(b, bounds) for b in cell))
+
+# ── Plan checks ────────────────────────────────────────────────────────────
+def _panel_bullets(data):
+    item = data["item"]
+    if isinstance(item, dict):
+        return len(item.get("details", ())) + (item.get("price") is not None)
+    return len(item[3])
+
+# section name -> [(template, item count of a slide's data)]
+SECTION_LAYOUTS = {
+    "title":        [("title.stats", lambda d: len(d["stats"]))],
+    "overview":     [("overview.bullets", lambda d: len(d["bullets"])),
+                     ("overview.info", lambda d: len(d["info"]))],
+    "tech_stack":   [("tech_stack.cards", lambda d: len(d["tech"]))],
+    "screenshots":  [("panel.bullets", _panel_bullets)],
+    "products":     [("panel.bullets", _panel_bullets)],
+    "architecture": [("architecture.fe_items", lambda d: len(d["fe_items"])),
+                     ("architecture.be_items", lambda d: len(d["be_items"])),
+                     ("architecture.stats", lambda d: len(d["arch_stats"]))],
+    "schema":       [("schema.columns", lambda d: len(d["schemas"])),
+                     ("schema.fields", lambda d: max((len(f) for _, f in d["schemas"]), default=0))],
+    "features":     [("features.cards", lambda d: len(d["features"]))],
+    "challenges":   [("challenges.rows", lambda d: len(d["challenges"]))],
+    "thank_you":    [("thank_you.contacts", lambda d: len(d["contacts"]))],
+}
+
+def check_slide(name, data):
+    """Yield ``(template, count, overflowing)`` for every block of section
+    ``name`` whose items from ``data`` will not fit."""
+    for template, count_of in SECTION_LAYOUTS.get(name, ()):
+        count = count_of(data)
+        extra = overflow(template, count)
+        if extra:
+            yield template, count, extra
+
+def check_plan(plan):
+    """Yield ``(slide number, section, template, count, overflowing)`` for
+    every slide of ``plan`` with items that will not fit."""
+    for n, (name, data) in enumerate(plan, 1):
+        for found in check_slide(name, data):
+            yield (n, name) + found
+
+# ── Pictures ───────────────────────────────────────────────────────────────
+# section name -> image paths (possibly None or missing) a slide's data places
+SECTION_PICTURES = {
+    "screenshots": lambda d: [(d["screenshots"].get(d["item"][2]), "panel.picture")],
+    "products":    lambda d: [(d["item"].get("image"), "panel.picture")],
+}
+
+def slide_pictures(name, data):
+    """``(path, Box)`` of every picture a ``name`` slide built from ``data``
+    places, whether or not the file exists — read ahead by the image
+    prefetcher without running the builder."""
+    return [(path, layout(template, 1)[0].picture)
+            for path, template in SECTION_PICTURES.get(name, lambda d: ())(data) if path]
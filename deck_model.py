@@ -0,0 +1,39 @@
+"""
+Fine Jewellery's — intermediate slide model.
+
+The slide builders draw through a handful of helpers (``fill_bg``,
+``add_rect``, ``add_text``, ``add_picture``, ``add_table``,
+``add_chart``).  Handed a ``SlideModel`` instead of a python-pptx slide,
+those helpers record what they would draw — one shape tuple per call,
+fields in the helper's own argument order — so the same builder code
+yields a plain description of the slide.  ``deck_engine.
+draw_model`` replays a model onto a real slide; ``deck_preview`` renders
+it to HTML and PNG thumbnails.
+
+Values are kept as the builders pass them: boxes and sizes in EMU, colours
+as ``RGBColor`` (a hex string via ``str``), alignment as ``PP_ALIGN``.
+"""
+
+from collections import namedtuple
+
+Rect = namedtuple("Rect", "left top width height fill_color line_color line_width")
+Text = namedtuple("Text", "text left top width height font_size bold color align font_name italic")
+Picture = namedtuple("Picture", "path left top width height")
+Table = namedtuple("Table", "rows left top width height font_size widths right")
+Chart = namedtuple("Chart", "kind categories series left top width height number_format")
+
+class SlideModel:
+    """Background colour plus shapes in drawing order (back to front)."""
+
+    __slots__ = ("background", "shapes")
+
+    def __init__(self):
+        self.background = None
+        self.shapes = []
+
+    def add(self, shape):
+        self.shapes.append(shape)
+        return shape
+
+    def __repr__(self):
+        return f"<SlideModel {self.background} {len(self.shapes)} shapes>"
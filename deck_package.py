@@ -0,0 +1,269 @@
+"""
+Fine Jewellery's — streaming .pptx package writer.
+
+``prs.save`` needs every slide and image of the deck in memory at once.
+``PackageWriter`` instead writes each finished slide part (and its rels)
+to the zip as soon as it is built, deduplicating media by content hash
+and copying the other parts a slide owns (charts and their embedded
+workbooks) under fresh partnames, and only writes the small package-level
+parts — ``presentation.xml``, its rels and ``[Content_Types].xml`` — when
+the deck is closed.  The caller
+builds each slide on a scratch presentation and drops it afterwards, so
+peak memory stays flat however many slides the deck has.
+
+``save_presentation`` is the whole-deck counterpart of ``prs.save``: parts
+are serialized and deflated on a thread pool (lxml and zlib release the
+GIL) and written in order by one thread.  Both writers take a deflate
+level and store already-compressed media (PNG, JPEG, …) as-is.
+
+Either writes to a path or to any writable binary stream — a ``BytesIO``,
+a socket's ``makefile("wb")``, ``sys.stdout.buffer``, an HTTP response
+object with only ``write``.  Members are deflated in memory before they
+are written, so sizes are known up front and the zip never seeks back
+(no data descriptors either); ``PackageWriter`` flushes a stream after
+every slide, so the deck leaves the process while it is being built.
+"""
+
+import hashlib
+import io
+import os
+import posixpath
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import quoteattr
+
+from lxml import etree
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.opc.oxml import serialize_part_xml
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+XML_HEADER = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+# Package-level parts rewritten on close; everything else is copied as-is.
+_PATCHED = ("[Content_Types].xml", "ppt/presentation.xml", "ppt/_rels/presentation.xml.rels")
+
+COMPRESSLEVEL = 6          # zlib's default, and what prs.save uses
+# Media that is compressed already; deflating it again only costs time.
+STORED_EXTS = frozenset(("png", "jpg", "jpeg", "gif", "tif", "tiff", "wdp", "mp3", "m4a", "mp4", "mov",
+                         "xlsx"))
+
+def _stored(membername):
+    return membername.rpartition(".")[2].lower() in STORED_EXTS
+
+class _WriteOnly:
+    """Adds the ``flush`` zipfile expects to an object with only ``write``."""
+
+    def __init__(self, target):
+        self.write = target.write
+
+    def flush(self):
+        pass
+
+def _output(output):
+    if isinstance(output, (str, os.PathLike)):
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        return output
+    if hasattr(output, "flush"):
+        return output
+    return _WriteOnly(output)
+
+def drop_slide(prs, slide):
+    """Remove the most recently added ``slide`` from ``prs`` again."""
+    sldIdLst = prs.slides._sldIdLst
+    sldId = sldIdLst[-1]
+    assert prs.part.related_part(sldId.rId) is slide.part
+    sldIdLst.remove(sldId)
+    prs.part.drop_rel(sldId.rId)
+
+def _rels_xml(rels):
+    """Serialize ``[(rId, reltype, target), ...]`` as a rels part."""
+    items = "".join(f"<Relationship Id={quoteattr(rId)} Type={quoteattr(reltype)} "
+                    f"Target={quoteattr(target)}/>" for rId, reltype, target in rels)
+    return XML_HEADER + (f'<Relationships xmlns="{NS_PKG_RELS}">{items}</Relationships>').encode("utf-8")
+
+class PackageWriter:
+    """Write a deck to ``output`` one slide at a time.
+
+    ``template`` is a presentation with no slides yet (its parts become the
+    package skeleton); ``output`` is a path or a writable binary stream,
+    flushed after every slide.
+    """
+
+    def __init__(self, template, output, compression=zipfile.ZIP_DEFLATED, compresslevel=COMPRESSLEVEL):
+        skeleton = io.BytesIO()
+        template.save(skeleton)
+        self._skeleton = zipfile.ZipFile(skeleton)
+        self._zip = zipfile.ZipFile(_output(output), "w")
+        self._level = compresslevel if compression == zipfile.ZIP_DEFLATED else None
+        self._date_time = time.localtime(time.time())[:6]
+        self._stream = not isinstance(output, (str, os.PathLike))
+        self._slide_rIds = []
+        self._media = {}          # sha1 -> partname
+        self._media_exts = {}     # ext -> content type
+        self._owned = {}          # partname stem -> parts copied, e.g. "ppt/charts/chart" -> 3
+        self._overrides = []      # (partname, content type) of copied parts
+        for name in self._skeleton.namelist():
+            if name not in _PATCHED:
+                self._write(name, self._skeleton.read(name))
+        self._pres_rels = etree.fromstring(self._skeleton.read("ppt/_rels/presentation.xml.rels"))
+        self._next_rId = 1 + max(int(rel.get("Id")[3:]) for rel in self._pres_rels)
+
+    def _write(self, membername, data):
+        _write_packed(self._zip, _pack(membername, data, self._level), self._date_time)
+
+    @property
+    def slide_count(self):
+        return len(self._slide_rIds)
+
+    def _add_media(self, part):
+        sha1 = hashlib.sha1(part.blob).hexdigest()
+        partname = self._media.get(sha1)
+        if partname is None:
+            ext = part.partname.ext
+            partname = f"ppt/media/image{len(self._media) + 1}.{ext}"
+            self._write(partname, part.blob)
+            self._media[sha1] = partname
+            self._media_exts.setdefault(ext, part.content_type)
+        return partname
+
+    def _rels_of(self, part, folder):
+        """``[(rId, reltype, target)]`` of ``part`` as written to ``folder``,
+        copying the media and owned parts it relates to."""
+        rels = []
+        for rId, rel in part.rels.items():
+            if rel.is_external:
+                rels.append((rId, rel.reltype, rel.target_ref))
+            elif rel.reltype == RT.IMAGE:
+                target = self._add_media(rel.target_part)
+                rels.append((rId, rel.reltype, posixpath.relpath(target, folder)))
+            elif rel.reltype in (RT.CHART, RT.PACKAGE, RT.OLE_OBJECT):
+                target = self._add_owned(rel.target_part)
+                rels.append((rId, rel.reltype, posixpath.relpath(target, folder)))
+            else:
+                rels.append((rId, rel.reltype, rel.target_ref))
+        return rels
+
+    def _add_owned(self, part):
+        """Copy a part only one slide refers to under a partname unique in
+        the output (scratch slides are dropped, so their partnames repeat)."""
+        stem, ext = posixpath.splitext(part.partname.membername)
+        stem = stem.rstrip("0123456789")
+        n = self._owned[stem] = self._owned.get(stem, 0) + 1
+        partname = f"{stem}{n}{ext}"
+        folder, filename = posixpath.split(partname)
+        rels = self._rels_of(part, folder) if part._rels else ()
+        self._write(partname, part.blob)
+        if rels:
+            self._write(f"{folder}/_rels/{filename}.rels", _rels_xml(rels))
+        self._overrides.append((partname, part.content_type))
+        return partname
+
+    def add_slide(self, slide):
+        """Write ``slide`` (built on the scratch presentation) as the next slide."""
+        n = self.slide_count + 1
+        partname = f"ppt/slides/slide{n}.xml"
+        rels = self._rels_of(slide.part, "ppt/slides")
+        self._write(partname, slide.part.blob)
+        self._write(f"ppt/slides/_rels/slide{n}.xml.rels", _rels_xml(rels))
+        self._slide_rIds.append(f"rId{self._next_rId}")
+        self._next_rId += 1
+        if self._stream:
+            self._zip.fp.flush()
+
+    def close(self):
+        """Write the package-level parts and finish the zip."""
+        # presentation.xml: list every slide in <p:sldIdLst>
+        pres = etree.fromstring(self._skeleton.read("ppt/presentation.xml"))
+        sldIdLst = pres.find(f"{{{NS_P}}}sldIdLst")
+        if sldIdLst is None:
+            sldIdLst = etree.Element(f"{{{NS_P}}}sldIdLst")
+            pres.find(f"{{{NS_P}}}sldMasterIdLst").addnext(sldIdLst)
+        for i, rId in enumerate(self._slide_rIds):
+            etree.SubElement(sldIdLst, f"{{{NS_P}}}sldId", {"id": str(256 + i), f"{{{NS_R}}}id": rId})
+        self._write("ppt/presentation.xml", XML_HEADER + etree.tostring(pres))
+
+        for n, rId in enumerate(self._slide_rIds, 1):
+            etree.SubElement(self._pres_rels, f"{{{NS_PKG_RELS}}}Relationship",
+                             Id=rId, Type=RT.SLIDE, Target=f"slides/slide{n}.xml")
+        self._write("ppt/_rels/presentation.xml.rels", XML_HEADER + etree.tostring(self._pres_rels))
+
+        types = etree.fromstring(self._skeleton.read("[Content_Types].xml"))
+        known = {d.get("Extension").lower() for d in types.iter(f"{{{NS_CT}}}Default")}
+        for ext, content_type in self._media_exts.items():
+            if ext.lower() not in known:
+                types.insert(0, etree.Element(f"{{{NS_CT}}}Default", Extension=ext, ContentType=content_type))
+        for n in range(1, self.slide_count + 1):
+            etree.SubElement(types, f"{{{NS_CT}}}Override",
+                             PartName=f"/ppt/slides/slide{n}.xml", ContentType=CT.PML_SLIDE)
+        for partname, content_type in self._overrides:
+            etree.SubElement(types, f"{{{NS_CT}}}Override", PartName=f"/{partname}", ContentType=content_type)
+        self._write("[Content_Types].xml", XML_HEADER + etree.tostring(types))
+        self._zip.close()
+        self._skeleton.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
+
+# ── Whole-deck save ────────────────────────────────────────────────────────
+def _pack(membername, data, level):
+    """``(membername, size, crc, compress type, payload)`` of one zip member."""
+    crc = zlib.crc32(data)
+    if level is None or _stored(membername):
+        return membername, len(data), crc, zipfile.ZIP_STORED, data
+    deflate = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return membername, len(data), crc, zipfile.ZIP_DEFLATED, deflate.compress(data) + deflate.flush()
+
+def _pack_part(part, level):
+    # part.blob serializes an XML part's lxml tree, the expensive step
+    members = [_pack(part.partname.membername, part.blob, level)]
+    if part._rels:
+        members.append(_pack(part.partname.rels_uri.membername, part.rels.xml, level))
+    return members
+
+def _write_packed(zf, member, date_time):
+    """Append a member whose payload is already compressed.  ZipFile has no
+    public API for this; this mirrors what ``ZipFile.writestr`` does."""
+    membername, size, crc, compress_type, payload = member
+    zinfo = zipfile.ZipInfo(membername, date_time)
+    zinfo.compress_type = compress_type
+    zinfo.file_size, zinfo.compress_size, zinfo.CRC = size, len(payload), crc
+    zinfo.external_attr = 0o600 << 16
+    zinfo.header_offset = zf.fp.tell()
+    zf.fp.write(zinfo.FileHeader())
+    zf.fp.write(payload)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[membername] = zinfo
+    zf.start_dir = zf.fp.tell()
+    zf._didModify = True
+
+def save_presentation(prs, output, workers=None, compresslevel=COMPRESSLEVEL):
+    """Save ``prs`` to ``output`` (a path or writable binary stream) like
+    ``prs.save``, serializing and deflating parts on ``workers`` threads
+    (default: one per CPU)."""
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    date_time = time.localtime(time.time())[:6]
+    with zipfile.ZipFile(_output(output), "w") as zf:
+        head = [_pack(CONTENT_TYPES_URI.membername,
+                      serialize_part_xml(_ContentTypesItem.xml_for(parts)), compresslevel),
+                _pack(PACKAGE_URI.rels_uri.membername, package._rels.xml, compresslevel)]
+        for member in head:
+            _write_packed(zf, member, date_time)
+        with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+            for members in pool.map(_pack_part, parts, [compresslevel] * len(parts)):
+                for member in members:
+                    _write_packed(zf, member, date_time)
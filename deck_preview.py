@@ -0,0 +1,253 @@
+"""
+Fine Jewellery's — HTML preview and PNG thumbnails of a deck.
+
+    build_preview(plan, "preview/")   →  preview/index.html
+                                          preview/thumbs/slide001.png …
+                                          preview/media/<sha1>.png|jpg
+
+Both outputs are rendered from the same ``deck_model.SlideModel`` the
+builders produce for the .pptx, so the preview can never drift from the
+deck.  Thumbnails are rasterized with Pillow (rectangles, wrapped text,
+pictures, tables and simplified charts — the only shapes the builders
+use), no LibreOffice or PowerPoint round-trip; in the HTML, charts are
+inline SVG.  Slides are rendered in parallel on a process pool,
+each worker building its slide's model and writing its own files.
+"""
+
+import hashlib
+import html
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+import deck_engine
+from deck_images import load_image
+from deck_model import Chart, Picture, Rect, Table, Text
+from deck_text import EMU_PER_PT, INSET_X, INSET_Y, LINE_SPACING, find_font, wrap_lines
+
+THUMB_WIDTH = 320
+
+def _rgb(color):
+    return tuple(color) if color is not None else None
+
+def _hex(color):
+    return f"#{color}" if color is not None else "transparent"
+
+def _align(align):
+    return getattr(align, "name", "LEFT").lower()
+
+def _fractions(weights):
+    whole = sum(weights)
+    return [w / whole for w in weights]
+
+def _table_colors(r):
+    """``(fill, text)`` of table row ``r``, as ``deck_engine.add_table`` draws it."""
+    if r == 0:
+        return deck_engine.GOLD, deck_engine.DARK
+    return (deck_engine.DARK3 if r % 2 else deck_engine.DARK2), deck_engine.WHITE
+
+def _bars(chart):
+    """``(category, value, fraction of the largest)`` of a chart's first series."""
+    values = chart.series[0][1] if chart.series else ()
+    top = max(values, default=0) or 1
+    return [(c, v, max(v, 0) / top) for c, v in zip(chart.categories, values)]
+
+# ── Thumbnails ─────────────────────────────────────────────────────────────
+@lru_cache(maxsize=256)
+def _font(name, bold, px):
+    path = find_font(name, bold) or find_font(name)
+    try:
+        return ImageFont.truetype(path, px) if path else ImageFont.load_default(px)
+    except OSError:
+        return ImageFont.load_default(px)
+
+def render_thumbnail(model, slide_size, width=THUMB_WIDTH):
+    """Rasterize ``model`` (a slide of ``slide_size`` EMU) ``width`` px wide."""
+    slide_w, slide_h = slide_size
+    scale = width / slide_w
+    img = Image.new("RGB", (width, round(slide_h * scale)), _rgb(model.background) or (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for shape in model.shapes:
+        x0, y0 = round(shape.left * scale), round(shape.top * scale)
+        x1, y1 = x0 + max(1, round(shape.width * scale)) - 1, y0 + max(1, round(shape.height * scale)) - 1
+        if type(shape) is Rect:
+            outline = _rgb(shape.line_color)
+            draw.rectangle((x0, y0, x1, y1), fill=_rgb(shape.fill_color), outline=outline,
+                           width=max(1, round(shape.line_width * scale)) if outline else 0)
+        elif type(shape) is Picture:
+            blob = load_image(shape.path, shape.width, shape.height)
+            if blob is not None:
+                with Image.open(io.BytesIO(blob)) as pic:
+                    img.paste(pic.convert("RGB").resize((x1 - x0 + 1, y1 - y0 + 1)), (x0, y0))
+        elif type(shape) is Text:
+            size = shape.font_size / EMU_PER_PT
+            font = _font(shape.font_name, bool(shape.bold), max(1, round(shape.font_size * scale)))
+            pitch = size * LINE_SPACING * EMU_PER_PT * scale
+            y = y0 + INSET_Y / 2 * scale
+            for line in wrap_lines(shape.text, shape.width, shape.font_name, size, bool(shape.bold)):
+                x = x0 + INSET_X / 2 * scale
+                room = (shape.width - INSET_X) * scale - draw.textlength(line, font=font)
+                x += {"center": room / 2, "right": room}.get(_align(shape.align), 0)
+                draw.text((x, y), line, font=font, fill=_rgb(shape.color))
+                y += pitch
+        elif type(shape) is Table:
+            row_h = (y1 - y0 + 1) / len(shape.rows)
+            font = _font("Calibri", False, max(1, round(shape.font_size * scale)))
+            for r, values in enumerate(shape.rows):
+                fill, color = _table_colors(r)
+                top = y0 + r * row_h
+                draw.rectangle((x0, top, x1, top + row_h), fill=_rgb(fill))
+                x = x0
+                for value, frac in zip(values, _fractions(shape.widths)):
+                    draw.text((x + 2, top + 1), value, font=font, fill=_rgb(color))
+                    x += frac * (x1 - x0 + 1)
+        elif type(shape) is Chart:
+            if shape.kind == "bar":
+                bars = _bars(shape)
+                pitch = (y1 - y0 + 1) / max(len(bars), 1)
+                for i, (_, _, frac) in enumerate(bars):
+                    top = y0 + i * pitch + pitch * 0.2
+                    draw.rectangle((x0, top, x0 + frac * (x1 - x0), top + pitch * 0.6),
+                                   fill=_rgb(deck_engine.GOLD))
+            else:
+                bars = _bars(shape)
+                step = (x1 - x0) / max(len(bars) - 1, 1)
+                points = [(x0 + i * step, y1 - frac * (y1 - y0)) for i, (_, _, frac) in enumerate(bars)]
+                if len(points) > 1:
+                    draw.line(points, fill=_rgb(deck_engine.GOLD), width=max(1, round(scale * 28575)))
+    return img
+
+# ── HTML ───────────────────────────────────────────────────────────────────
+def _media(picture, out_dir):
+    """Write the prepared image of ``picture`` under ``out_dir/media``; return
+    its URL, or None when the file is missing."""
+    blob = load_image(picture.path, picture.width, picture.height)
+    if blob is None:
+        return None
+    ext = "png" if blob.startswith(b"\x89PNG") else "jpg"
+    name = f"{hashlib.sha1(blob).hexdigest()}.{ext}"
+    path = os.path.join(out_dir, "media", name)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(blob)
+    return f"media/{name}"
+
+def _html_table(table):
+    cols = "".join(f'<col style="width:{frac * 100:.2f}%">' for frac in _fractions(table.widths))
+    rows = []
+    for r, values in enumerate(table.rows):
+        fill, color = _table_colors(r)
+        cells = "".join(f'<td style="text-align:{"right" if c in table.right else "left"}">{html.escape(v)}</td>'
+                        for c, v in enumerate(values))
+        rows.append(f'<tr style="background:{_hex(fill)};color:{_hex(color)}'
+                    f'{";font-weight:bold" if r == 0 else ""}">{cells}</tr>')
+    return f"<colgroup>{cols}</colgroup>{''.join(rows)}"
+
+def _svg_chart(chart):
+    """The chart as an SVG 1000 units wide, its bars or line in gold."""
+    bars, gold, muted = _bars(chart), _hex(deck_engine.GOLD), _hex(deck_engine.MUTED)
+    parts = []
+    if chart.kind == "bar":
+        pitch = 1000 * chart.height / chart.width / max(len(bars), 1)
+        for i, (category, value, frac) in enumerate(bars):
+            y = i * pitch
+            parts.append(f'<text x="230" y="{y + pitch * 0.6:.1f}" text-anchor="end" fill="{muted}" '
+                         f'font-size="{pitch * 0.35:.1f}">{html.escape(str(category))}</text>'
+                         f'<rect x="240" y="{y + pitch * 0.2:.1f}" width="{frac * 620:.1f}" '
+                         f'height="{pitch * 0.6:.1f}" fill="{gold}"><title>{value:,.0f}</title></rect>')
+    elif len(bars) > 1:
+        height = 1000 * chart.height / chart.width
+        step = 1000 / (len(bars) - 1)
+        points = " ".join(f"{i * step:.1f},{height * (1 - frac):.1f}" for i, (_, _, frac) in enumerate(bars))
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{gold}" stroke-width="4"/>')
+    return (f'<svg viewBox="0 0 1000 {1000 * chart.height / chart.width:.1f}" '
+            f'preserveAspectRatio="none">{"".join(parts)}</svg>')
+
+def html_slide(model, number, label, slide_size, out_dir):
+    """One ``<section>`` of the preview page.  Boxes are percentages of the
+    slide and font sizes ``cqw`` units, so the slide scales as a whole."""
+    slide_w, slide_h = slide_size
+    pct = lambda emu, total: f"{emu / total * 100:.3f}%"
+    cqw = lambda emu: f"{emu / slide_w * 100:.3f}cqw"
+    parts = []
+    for shape in model.shapes:
+        box = (f"left:{pct(shape.left, slide_w)};top:{pct(shape.top, slide_h)};"
+               f"width:{pct(shape.width, slide_w)};height:{pct(shape.height, slide_h)}")
+        if type(shape) is Rect:
+            border = (f";border:{cqw(shape.line_width)} solid {_hex(shape.line_color)}"
+                      if shape.line_color is not None else "")
+            parts.append(f'<div style="{box};background:{_hex(shape.fill_color)}{border}"></div>')
+        elif type(shape) is Picture:
+            src = _media(shape, out_dir)
+            if src is not None:
+                parts.append(f'<img style="{box}" src="{src}" '
+                             f'alt="{html.escape(os.path.basename(shape.path))}">')
+        elif type(shape) is Text:
+            family = "Georgia, serif" if shape.font_name == "Georgia" else f"{shape.font_name}, Carlito, sans-serif"
+            style = (f"{box};padding:{cqw(INSET_Y // 2)} {cqw(INSET_X // 2)};font-family:{family};"
+                     f"font-size:{cqw(shape.font_size)};color:{_hex(shape.color)};"
+                     f"text-align:{_align(shape.align)}"
+                     + (";font-weight:bold" if shape.bold else "") + (";font-style:italic" if shape.italic else ""))
+            parts.append(f'<p style="{style}">{html.escape(shape.text)}</p>')
+        elif type(shape) is Table:
+            parts.append(f'<table style="{box};font-size:{cqw(shape.font_size)}">{_html_table(shape)}</table>')
+        elif type(shape) is Chart:
+            parts.append(f'<div style="{box}">{_svg_chart(shape)}</div>')
+    return (f'<section id="slide{number}" class="slide" style="background:{_hex(model.background)}" '
+            f'aria-label="Slide {number} — {html.escape(label)}">{"".join(parts)}</section>')
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8" />
+  <title>{title}</title>
+  <style>
+    body {{ background: #111; margin: 0; padding: 24px; font-family: sans-serif; color: #888; }}
+    nav {{ display: flex; flex-wrap: wrap; gap: 8px; margin-bottom: 24px; }}
+    nav img {{ width: 160px; display: block; border: 1px solid #333; }}
+    .slide {{ position: relative; container-type: inline-size; width: min(100%, 1280px);
+              aspect-ratio: {aspect}; margin: 0 auto 24px; overflow: hidden; }}
+    .slide > * {{ position: absolute; box-sizing: border-box; margin: 0; }}
+    .slide > p {{ line-height: {line}; white-space: pre-wrap; overflow-wrap: break-word; }}
+    .slide > table {{ border-collapse: collapse; font-family: Calibri, Carlito, sans-serif; }}
+    .slide > table td {{ padding: 0 0.6cqw; }}
+    .slide svg {{ width: 100%; height: 100%; display: block; }}
+  </style>
+</head>
+<body>
+<nav>{nav}</nav>
+{slides}
+</body>
+</html>
+"""
+
+# ── Driver ─────────────────────────────────────────────────────────────────
+def _preview_slide(job):
+    """Worker: model, thumbnail and HTML of one slide; returns the HTML."""
+    number, name, data, out_dir, width = job
+    model = deck_engine.model_slide(name, data)
+    size = (deck_engine.W, deck_engine.H)
+    render_thumbnail(model, size, width).save(os.path.join(out_dir, "thumbs", f"slide{number:03d}.png"))
+    return html_slide(model, number, name, size, out_dir)
+
+def build_preview(plan, out_dir, workers=None, width=THUMB_WIDTH, title="Fine Jewellery's — Deck Preview"):
+    """Render every ``(name, data)`` of ``plan`` into ``out_dir``; returns
+    the path of ``index.html``.  ``workers=1`` renders in this process."""
+    for sub in ("thumbs", "media"):
+        os.makedirs(os.path.join(out_dir, sub), exist_ok=True)
+    jobs = [(n, name, data, out_dir, width) for n, (name, data) in enumerate(plan, 1)]
+    if workers == 1 or len(jobs) < 2:
+        slides = [_preview_slide(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            slides = list(pool.map(_preview_slide, jobs, chunksize=max(1, len(jobs) // 64)))
+    nav = "".join(f'<a href="#slide{n}"><img src="thumbs/slide{n:03d}.png" alt="Slide {n}"></a>'
+                  for n, *_ in jobs)
+    index = os.path.join(out_dir, "index.html")
+    with open(index, "w", encoding="utf-8") as f:
+        f.write(PAGE.format(title=html.escape(title), aspect=f"{deck_engine.W} / {deck_engine.H}",
+                            line=LINE_SPACING, nav=nav, slides="\n".join(slides)))
+    return index
@@ -0,0 +1,158 @@
+"""
+Fine Jewellery's — build profiling for the PowerPoint generator.
+
+``profiled(module)`` temporarily wraps the slide builders, the shape
+helpers (``add_text``, ``add_rect``, ``add_picture``) and the package save
+(``save_presentation``, ``prs.save``, and ``PackageWriter.add_slide`` /
+``close`` for streamed builds) of a loaded generator module, recording
+wall time and allocation counts (net ``sys.getallocatedblocks()`` delta)
+per call.  Slides are numbered by their position in the plan; one grafted
+from a snapshot instead of built (incremental builds, ``SLIDE_CACHE``
+hits) is recorded as ``cached`` with the time the graft took.  The result
+can be written as a JSON report and as folded stacks
+(``frame;frame;frame µs``), the input format of flamegraph.pl /
+speedscope / inferno.
+"""
+
+import json
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from pptx.presentation import Presentation
+
+import deck_package
+
+HELPERS = ("add_text", "add_rect", "add_picture")
+
+class Profiler:
+    def __init__(self):
+        self._stack = []              # [label, child seconds]
+        self.folded = Counter()       # "a;b;c" -> self seconds
+        self.slides = []
+        self._entry = None            # (plan position, section) being rendered
+        self.helpers = defaultdict(lambda: {"calls": 0, "seconds": 0.0, "allocs": 0})
+        self.save = {"seconds": 0.0, "allocs": 0}
+        self.total = 0.0
+
+    def call(self, label, fn, *args, **kwargs):
+        """Run ``fn`` as a frame named ``label``; return ``(result, seconds, allocs)``."""
+        frame = [label, 0.0]
+        self._stack.append(frame)
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            allocs = sys.getallocatedblocks() - blocks
+            self.folded[";".join(f[0] for f in self._stack)] += seconds - frame[1]
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += seconds
+            else:
+                self.total += seconds
+        return result, seconds, allocs
+
+    def _helper(self, name, fn):
+        def wrapper(*args, **kwargs):
+            result, seconds, allocs = self.call(name, fn, *args, **kwargs)
+            stats = self.helpers[name]
+            stats["calls"] += 1
+            stats["seconds"] += seconds
+            stats["allocs"] += allocs
+            if self.slides and self._stack:
+                self.slides[-1]["helpers"][name] += 1
+            return result
+        return wrapper
+
+    def _slide(self, name, fn, *args, cached=False, **kwargs):
+        number = self._entry[0] if self._entry else len(self.slides) + 1
+        record = {"slide": number, "builder": name, "cached": cached,
+                  "seconds": 0.0, "allocs": 0, "helpers": Counter()}
+        self.slides.append(record)
+        label = f"slide{number:02d}:{name}" + (":cached" if cached else "")
+        result, record["seconds"], record["allocs"] = self.call(label, fn, *args, **kwargs)
+        return result
+
+    def _builder(self, name, fn):
+        def wrapper(slide, **data):
+            return self._slide(name, fn, slide, **data)
+        return wrapper
+
+    def _grafter(self, fn):
+        def wrapper(slide, snapshot):
+            return self._slide(self._entry[1] if self._entry else "?", fn, slide, snapshot, cached=True)
+        return wrapper
+
+    def _planned(self, plan):
+        for entry in enumerate(plan, 1):
+            self._entry = (entry[0], entry[1][0])
+            yield entry[1]
+        self._entry = None
+
+    def _renderer(self, fn):
+        def wrapper(prs, plan, *args, **kwargs):
+            return fn(prs, self._planned(plan), *args, **kwargs)
+        return wrapper
+
+    def _saver(self, fn):
+        def wrapper(*args, **kwargs):
+            result, seconds, allocs = self.call("save", fn, *args, **kwargs)
+            self.save["seconds"] += seconds
+            self.save["allocs"] += allocs
+            return result
+        return wrapper
+
+    # ── Output ─────────────────────────────────────────────────────────────
+    def report(self):
+        return {
+            "total_seconds": self.total,
+            "save": self.save,
+            "helpers": dict(self.helpers),
+            "slides": [dict(s, helpers=dict(s["helpers"])) for s in self.slides],
+        }
+
+    def write(self, prefix):
+        """Write ``<prefix>.json`` and ``<prefix>.folded``."""
+        with open(prefix + ".json", "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        with open(prefix + ".folded", "w", encoding="utf-8") as f:
+            for stack, seconds in sorted(self.folded.items()):
+                f.write(f"{stack} {round(seconds * 1e6)}\n")
+
+@contextmanager
+def profiled(module, root="build"):
+    """Instrument generator ``module`` for the duration of the block; the
+    block runs inside a root frame named ``root``."""
+    prof = Profiler()
+    saved = {name: getattr(module, name)
+             for name in HELPERS + ("save_presentation", "render_slides", "graft_slide")}
+    builders = dict(module.SLIDE_BUILDERS)
+    pres_save = Presentation.save
+    writer_add, writer_close = deck_package.PackageWriter.add_slide, deck_package.PackageWriter.close
+    for name in HELPERS:
+        setattr(module, name, prof._helper(name, saved[name]))
+    module.save_presentation = prof._saver(saved["save_presentation"])
+    module.render_slides = prof._renderer(saved["render_slides"])
+    module.graft_slide = prof._grafter(saved["graft_slide"])
+    for name, builder in builders.items():
+        module.SLIDE_BUILDERS[name] = builder._replace(fn=prof._builder(name, builder.fn))
+    Presentation.save = prof._saver(pres_save)
+    deck_package.PackageWriter.add_slide = prof._saver(writer_add)
+    deck_package.PackageWriter.close = prof._saver(writer_close)
+    frame = [root, 0.0]
+    prof._stack.append(frame)
+    start = time.perf_counter()
+    try:
+        yield prof
+    finally:
+        prof._stack.pop()
+        prof.total = time.perf_counter() - start
+        prof.folded[root] += prof.total - frame[1]
+        for name, fn in saved.items():
+            setattr(module, name, fn)
+        module.SLIDE_BUILDERS.update(builders)
+        Presentation.save = pres_save
+        deck_package.PackageWriter.add_slide, deck_package.PackageWriter.close = writer_add, writer_close
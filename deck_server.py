@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Fine Jewellery's — local deck render service.
+
+    python deck_server.py --port 8765 --workers 4 --queue 16
+    python deck_server.py --socket /tmp/deck.sock
+
+An asyncio HTTP front end feeding a bounded pool of worker processes.
+Each worker imports the deck engine and parses the default template once at
+start-up; every request then only clones the template and runs the slide
+builders.
+
+    POST /render    body: JSON spec overrides → the .pptx bytes
+    GET  /metrics   queue depth, in-flight, counters, p50/p99 latency
+    GET  /healthz
+
+When ``--queue`` requests are already waiting the service answers 503
+with ``Retry-After`` instead of queueing more (backpressure).  If a worker
+process dies (OOM kill, crash) the pool is replaced by a freshly warmed
+one and the requests that were running on it are retried once.  It binds to
+127.0.0.1 (or a Unix socket) only.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import statistics
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+PPTX_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+MAX_BODY = 4 * 1024 * 1024
+
+# ── Worker process ─────────────────────────────────────────────────────────
+def _warm():
+    """Pool initializer: pay the import and template parse up front."""
+    import deck_engine
+    deck_engine.new_presentation()
+
+def _render(spec):
+    """Build ``spec`` in memory; return ``(status, content type, body)``."""
+    import deck_engine
+    from deck_spec import SpecError, validate_spec
+    try:
+        validate_spec(spec, "request")
+        out = io.BytesIO()
+        deck_engine.build_deck(spec, out)
+    except SpecError as exc:
+        return 400, "text/plain", str(exc).encode()
+    return 200, PPTX_TYPE, out.getvalue()
+
+# ── Service ────────────────────────────────────────────────────────────────
+class RenderService:
+    def __init__(self, workers=2, queue_size=16, window=1024):
+        self.workers = workers
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.pool = None
+        self.latencies = deque(maxlen=window)   # seconds, most recent requests
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.pool_restarts = 0
+        self._dispatchers = []
+
+    def _new_pool(self):
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm)
+        # Warm every worker now rather than on the first requests.
+        for _ in range(self.workers):
+            pool.submit(_warm)
+        return pool
+
+    def _restart_pool(self, broken):
+        """Replace ``broken`` — once, however many dispatchers saw it fail."""
+        if self.pool is broken:
+            self.pool = self._new_pool()
+            self.pool_restarts += 1
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        self.pool = self._new_pool()
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+
+    async def close(self):
+        for task in self._dispatchers:
+            task.cancel()
+        self.pool.shutdown(cancel_futures=True)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            spec, future = await self.queue.get()
+            self.in_flight += 1
+            try:
+                result = await self._run(loop, spec)
+            except Exception as exc:
+                result = 500, "text/plain", f"render failed: {exc!r}".encode()
+            finally:
+                self.in_flight -= 1
+                self.queue.task_done()
+            if not future.cancelled():
+                future.set_result(result)
+
+    async def _run(self, loop, spec):
+        """Render ``spec`` on the pool; a request whose pool broke under it
+        is retried once on the replacement, then fails with the error."""
+        for attempt in range(2):
+            pool = self.pool
+            try:
+                return await loop.run_in_executor(pool, _render, spec)
+            except BrokenProcessPool:
+                self._restart_pool(pool)
+                if attempt:
+                    raise
+
+    async def render(self, spec):
+        """Queue ``spec``; raises ``asyncio.QueueFull`` when saturated."""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((spec, future))
+        return await future
+
+    def metrics(self):
+        lat = sorted(self.latencies)
+        pct = (lambda p: round(lat[min(len(lat) - 1, int(p * len(lat)))] * 1000, 1)) if lat else (lambda p: None)
+        return {
+            "queue_depth": self.queue.qsize(),
+            "queue_limit": self.queue.maxsize,
+            "in_flight": self.in_flight,
+            "workers": self.workers,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "pool_restarts": self.pool_restarts,
+            "latency_ms": {"p50": pct(0.50), "p99": pct(0.99),
+                           "mean": round(statistics.fmean(lat) * 1000, 1) if lat else None,
+                           "samples": len(lat)},
+        }
+
+    # ── HTTP ───────────────────────────────────────────────────────────────
+    async def handle(self, reader, writer):
+        try:
+            status, ctype, body, extra = await self._respond(reader)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            status, ctype, body, extra = 400, "text/plain", b"bad request", {}
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                f"Content-Type: {ctype}", f"Content-Length: {len(body)}", "Connection: close"]
+        head += [f"{k}: {v}" for k, v in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            raise ValueError("malformed request line")
+        method, path, _ = request_line
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if method == "GET" and path == "/healthz":
+            return 200, "text/plain", b"ok", {}
+        if method == "GET" and path == "/metrics":
+            return 200, "application/json", json.dumps(self.metrics()).encode(), {}
+        if path != "/render":
+            return 404, "text/plain", b"not found", {}
+        if method != "POST":
+            return 405, "text/plain", b"use POST", {"Allow": "POST"}
+
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY:
+            return 413, "text/plain", b"spec too large", {}
+        spec = json.loads(await reader.readexactly(length) or b"{}")
+        if not isinstance(spec, dict):
+            return 400, "text/plain", b"spec must be a JSON object", {}
+
+        start = time.perf_counter()
+        try:
+            status, ctype, body = await self.render(spec)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return 503, "text/plain", b"render queue full", {"Retry-After": "1"}
+        self.latencies.append(time.perf_counter() - start)
+        if status == 200:
+            self.completed += 1
+            return status, ctype, body, {"Content-Disposition": 'attachment; filename="deck.pptx"'}
+        self.failed += 1
+        return status, ctype, body, {}
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+async def serve(host="127.0.0.1", port=8765, socket_path=None, workers=2, queue_size=16):
+    service = RenderService(workers, queue_size)
+    service.start()
+    if socket_path:
+        server = await asyncio.start_unix_server(service.handle, path=socket_path)
+        where = socket_path
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        where = f"http://{host}:{port}"
+    print(f"💎 Deck render service on {where} ({workers} workers, queue {queue_size})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local deck render service.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=2, help="render processes")
+    parser.add_argument("--queue", type=int, default=16, help="max waiting requests before 503")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(port=args.port, socket_path=args.socket,
+                          workers=args.workers, queue_size=args.queue))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+Fine Jewellery's — slide snapshots for the PowerPoint generator.
+
+A snapshot is a finished slide's ``<p:cSld>`` XML plus the image blobs it
+references, keyed by relationship id.  Snapshots are read straight out of a
+saved .pptx (no ``Presentation`` object model) and grafted onto a fresh
+blank slide, so an unchanged slide costs one XML parse instead of hundreds
+of python-pptx setter calls.
+
+Incremental builds store one fingerprint per slide in a sidecar file next
+to the output (``<output>.slides.json``); a slide whose fingerprint matches
+one from the previous build is grafted from the previous output.
+
+Slides of cacheable sections are also kept across decks in a
+``SlideCache``: in memory for the process, and on disk (size-bounded,
+least recently used evicted first) for every process on the machine.
+"""
+
+import copy
+import hashlib
+import io
+import json
+import os
+import pickle
+import posixpath
+import zipfile
+from collections import OrderedDict, namedtuple
+
+from lxml import etree
+
+from deck_content import CACHE_DIR, write_atomic
+from deck_layout import slide_pictures
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+RT_IMAGE = NS_R + "/image"
+# Relationships a snapshot can carry; a slide with any other (a chart, an
+# embedded object) owns parts a snapshot does not hold and is rebuilt.
+_GRAFTABLE = {RT_IMAGE, NS_R + "/slideLayout", NS_R + "/notesSlide"}
+
+SlideSnapshot = namedtuple("SlideSnapshot", "xml media")
+
+SLIDE_CACHE_BYTES = 64 * 1024 * 1024   # on disk
+SLIDE_CACHE_ITEMS = 512                # in memory
+
+# ── Fingerprints ───────────────────────────────────────────────────────────
+def _file_stamps(name, data):
+    """``(path, mtime_ns, size)`` of every existing file a ``name`` slide
+    reads: the pictures it places — not every file of a shared mapping such
+    as ``screenshots`` — and any input that is itself a path (an order
+    export)."""
+    paths = [path for path, _ in slide_pictures(name, data)]
+    paths += [value for value in data.values() if isinstance(value, str)]
+    stamps = []
+    for path in dict.fromkeys(paths):
+        if os.path.isfile(path):
+            st = os.stat(path)
+            stamps.append((path, st.st_mtime_ns, st.st_size))
+    return stamps
+
+def slide_fingerprint(name, data, version=""):
+    """Hash of a slide's builder, its data, the files the slide reads and
+    ``version`` (anything JSON-serialisable naming the drawing setup)."""
+    payload = json.dumps([version, name, data, _file_stamps(name, data)],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# ── Snapshots ──────────────────────────────────────────────────────────────
+def snapshot_slide(slide):
+    """Capture a built python-pptx ``slide`` as a ``SlideSnapshot``."""
+    media = {}
+    for rId, rel in slide.part.rels.items():
+        if rel.reltype == RT_IMAGE and not rel.is_external:
+            media[rId] = rel.target_part.blob
+    xml = etree.tostring(slide._element.find(f"{{{NS_P}}}cSld"))
+    return SlideSnapshot(xml, media)
+
+def read_snapshot(zf, partname):
+    """Read the slide at ``partname`` (e.g. ``ppt/slides/slide3.xml``) from an
+    open ``zipfile.ZipFile`` of a saved deck; None when it relates to parts
+    other than images."""
+    root = etree.fromstring(zf.read(partname))
+    cSld = root.find(f"{{{NS_P}}}cSld")
+    media = {}
+    folder, filename = posixpath.split(partname)
+    rels_name = posixpath.join(folder, "_rels", filename + ".rels")
+    if rels_name in zf.namelist():
+        rels = etree.fromstring(zf.read(rels_name))
+        for rel in rels.iter(f"{{{NS_PKG_RELS}}}Relationship"):
+            if rel.get("Type") not in _GRAFTABLE:
+                return None
+            if rel.get("Type") == RT_IMAGE and rel.get("TargetMode") != "External":
+                target = posixpath.normpath(posixpath.join(folder, rel.get("Target")))
+                media[rel.get("Id")] = zf.read(target)
+    return SlideSnapshot(etree.tostring(cSld), media)
+
+def graft_slide(slide, snapshot):
+    """Replace the content of blank ``slide`` with ``snapshot``."""
+    cSld = etree.fromstring(snapshot.xml) if isinstance(snapshot.xml, bytes) else copy.deepcopy(snapshot.xml)
+    rIds = {}
+    for old_rId, blob in snapshot.media.items():
+        _, rIds[old_rId] = slide.part.get_or_add_image_part(io.BytesIO(blob))
+    if rIds:
+        for el in cSld.iter():
+            for attr in (f"{{{NS_R}}}embed", f"{{{NS_R}}}link"):
+                if el.get(attr) in rIds:
+                    el.set(attr, rIds[el.get(attr)])
+    old = slide._element.find(f"{{{NS_P}}}cSld")
+    slide._element.replace(old, cSld)
+    return slide
+
+# ── Previous build ─────────────────────────────────────────────────────────
+def sidecar_path(output):
+    return output + ".slides.json"
+
+class PreviousBuild:
+    """Slides of the last build of ``output``, looked up by fingerprint."""
+
+    def __init__(self, output):
+        self._zip = None
+        self._parts = {}
+        try:
+            with open(sidecar_path(output), encoding="utf-8") as f:
+                meta = json.load(f)
+            st = os.stat(output)
+        except (OSError, ValueError):
+            return
+        if (st.st_size, st.st_mtime_ns) != (meta.get("size"), meta.get("mtime_ns")):
+            return  # output was touched since it was written; trust nothing
+        with open(output, "rb") as f:
+            self._zip = zipfile.ZipFile(io.BytesIO(f.read()))
+        for i, fp in enumerate(meta["slides"]):
+            self._parts.setdefault(fp, f"ppt/slides/slide{i + 1}.xml")
+
+    def get(self, fingerprint):
+        partname = self._parts.get(fingerprint)
+        if partname is None:
+            return None
+        return read_snapshot(self._zip, partname)
+
+def write_sidecar(output, fingerprints):
+    st = os.stat(output)
+    with open(sidecar_path(output), "w", encoding="utf-8") as f:
+        json.dump({"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                   "slides": fingerprints}, f, indent=1)
+
+# ── Cross-deck slide cache ─────────────────────────────────────────────────
+class SlideCache:
+    """Snapshots of finished slides by fingerprint, shared across decks.
+
+    Hits come from an in-process LRU of ``max_items`` snapshots, then from
+    ``<cache_dir>/slides/<fingerprint>.slide``.  Disk entries are touched
+    on every hit, and once the folder grows past ``max_bytes`` the least
+    recently used ones are deleted.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=SLIDE_CACHE_BYTES, max_items=SLIDE_CACHE_ITEMS):
+        self.folder = os.path.join(cache_dir or CACHE_DIR, "slides")
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        self._disk_bytes = None     # scanned on first write
+
+    def _path(self, fingerprint):
+        return os.path.join(self.folder, f"{fingerprint}.slide")
+
+    def get(self, fingerprint):
+        snapshot = self._memory.get(fingerprint)
+        if snapshot is not None:
+            self._memory.move_to_end(fingerprint)
+            return snapshot
+        path = self._path(fingerprint)
+        try:
+            with open(path, "rb") as f:
+                snapshot = SlideSnapshot(*pickle.load(f))
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, TypeError):
+            return None
+        self._remember(fingerprint, snapshot)
+        return snapshot
+
+    def put(self, fingerprint, snapshot):
+        self._remember(fingerprint, snapshot)
+        path = self._path(fingerprint)
+        if os.path.exists(path):
+            return
+        os.makedirs(self.folder, exist_ok=True)
+        data = pickle.dumps(tuple(snapshot), pickle.HIGHEST_PROTOCOL)
+        write_atomic(path, data)
+        if self._disk_bytes is None:
+            self._disk_bytes = self._scan_bytes()
+        else:
+            self._disk_bytes += len(data)
+        if self._disk_bytes > self.max_bytes:
+            self.evict()
+
+    def _remember(self, fingerprint, snapshot):
+        self._memory[fingerprint] = snapshot
+        self._memory.move_to_end(fingerprint)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if name.endswith(".slide"):
+                try:
+                    st = os.stat(os.path.join(self.folder, name))
+                except OSError:
+                    continue    # evicted by another process meanwhile
+                entries.append((st.st_mtime_ns, st.st_size, name))
+        return entries
+
+    def _scan_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Delete least recently used disk entries until under ``max_bytes``."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.folder, name))
+            except OSError:
+                pass
+            total -= size
+        self._disk_bytes = total
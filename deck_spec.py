@@ -0,0 +1,209 @@
+"""
+Fine Jewellery's — deck spec files for the PowerPoint generator.
+
+A spec file is a stream of documents — a single JSON/YAML document, a
+multi-document YAML stream (``---``) or JSON Lines (``.jsonl``):
+
+* a *spec document* is a mapping of ``DEFAULT_SPEC`` keys.  It updates the
+  running spec and expands the sections in its ``slides`` list (the first
+  spec document defaults to the standard deck; use ``slides: []`` to emit
+  nothing, e.g. as the header of a catalogue);
+* a *slide document* has a ``builder`` key and produces exactly one slide.
+  Builder inputs it omits are taken from the running spec.
+
+``load_plan(path)`` validates documents as it reads them and yields
+``(builder name, data)`` pairs one at a time, so a catalogue of thousands
+of slides never sits in memory at once.  The compiled plan is written to a
+pickle stream keyed by file hash, builder code version and this module's
+own source (so a change to the validation rules compiles every spec
+again); later loads of the same file replay that stream without parsing or
+validating again.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+from deck_content import CACHE_DIR, DEFAULT_SPEC, SECTIONS, code_version, file_hash, plan_deck
+
+class SpecError(ValueError):
+    """A spec file document is invalid."""
+
+# ── Reading ────────────────────────────────────────────────────────────────
+def _documents(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif ext == ".json":
+        with open(path, encoding="utf-8") as f:
+            yield json.load(f)
+    elif ext in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError(f"{path}: reading YAML specs requires PyYAML") from None
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, encoding="utf-8") as f:
+            yield from yaml.load_all(f, Loader=loader)
+    else:
+        raise SpecError(f"{path}: unknown spec format {ext!r} (use .json, .jsonl, .yaml)")
+
+# ── Validation ─────────────────────────────────────────────────────────────
+# list key -> kind of each field of its entries (tuples in DEFAULT_SPEC)
+ITEM_FIELDS = {
+    "stats": ("string", "string"), "info": ("string", "string"),
+    "tech": ("string", "string"), "arch_stats": ("string", "string"),
+    "challenges": ("string", "string"),
+    "features": ("string", "string", "string"), "contacts": ("string", "string", "string"),
+    "schemas": ("string", "pairs"),                            # (title, [(field, type), …])
+    "screenshot_slides": ("integer", "string", "string", "strings"),
+}
+STRING_LISTS = ("slides", "bullets", "fe_items", "be_items")
+# ``products`` entry key -> kind; the first two are required
+PRODUCT_FIELDS = {"sku": "string", "name": "string", "category": "string",
+                  "price": "number", "details": "strings", "image": "string"}
+PRODUCT_KEYS = ("sku", "name")
+
+def _kind(value):
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, dict):
+        return "mapping"
+    if isinstance(value, (list, tuple)):
+        return "list"
+    return type(value).__name__
+
+def _is(kind, value):
+    """Whether ``value`` is of field kind ``kind`` (see ``ITEM_FIELDS``)."""
+    if kind == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if kind == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if kind == "strings":
+        return _kind(value) == "list" and all(isinstance(v, str) for v in value)
+    if kind == "pairs":
+        return _kind(value) == "list" and all(_is("strings", v) and len(v) == 2 for v in value)
+    return _kind(value) == kind
+
+def _check_entry(key, entry, where):
+    """Check one entry of list ``key`` — or the ``item`` of a slide document
+    whose builder takes one per entry of ``key``."""
+    if key == "products":
+        if not isinstance(entry, dict):
+            raise SpecError(f"{where}: {key!r} entries should be mappings, got {_kind(entry)}")
+        missing = [k for k in PRODUCT_KEYS if not entry.get(k)]
+        if missing:
+            raise SpecError(f"{where}: product {entry!r:.60} needs {missing}")
+        for field, kind in PRODUCT_FIELDS.items():
+            if entry.get(field) is not None and not _is(kind, entry[field]):
+                raise SpecError(f"{where}: product {field!r} should be {kind}, got {entry[field]!r:.60}")
+        return
+    if key in STRING_LISTS:
+        if not isinstance(entry, str):
+            raise SpecError(f"{where}: {key!r} entries should be strings, got {_kind(entry)}")
+        return
+    kinds = ITEM_FIELDS.get(key)
+    if kinds is None:
+        return
+    if (_kind(entry) != "list" or len(entry) != len(kinds)
+            or not all(_is(kind, v) for kind, v in zip(kinds, entry))):
+        raise SpecError(f"{where}: {key!r} entries should be [{', '.join(kinds)}], got {entry!r:.60}")
+
+def _check_value(key, value, where):
+    expected = _kind(DEFAULT_SPEC[key])
+    if _kind(value) != expected:
+        raise SpecError(f"{where}: {key!r} should be a {expected}, got {_kind(value)}")
+    if expected == "list":
+        for entry in value:
+            _check_entry(key, entry, where)
+
+def validate_spec(doc, where="spec"):
+    """Check a spec document's keys, value types and list entry shapes
+    against ``DEFAULT_SPEC``."""
+    if not isinstance(doc, dict):
+        raise SpecError(f"{where}: expected a mapping, got {_kind(doc)}")
+    for key, value in doc.items():
+        if key not in DEFAULT_SPEC:
+            raise SpecError(f"{where}: unknown spec key {key!r}")
+        _check_value(key, value, where)
+    for name in doc.get("slides", ()):
+        if name not in SECTIONS:
+            raise SpecError(f"{where}: unknown slide section {name!r}")
+
+def validate_slide(doc, where="slide"):
+    """Check a slide document against its builder's inputs."""
+    name = doc.get("builder")
+    if name not in SECTIONS:
+        raise SpecError(f"{where}: unknown builder {name!r}")
+    inputs, each = SECTIONS[name]
+    allowed = set(inputs) | ({"item"} if each else set())
+    unknown = set(doc) - allowed - {"builder"}
+    if unknown:
+        raise SpecError(f"{where}: {name!r} does not take {sorted(unknown)}")
+    if each and "item" not in doc:
+        raise SpecError(f"{where}: {name!r} slides need an 'item'")
+    for key in set(inputs) & set(doc):
+        _check_value(key, doc[key], where)
+    if each:
+        _check_entry(each, doc["item"], where)
+
+def compile_documents(documents, where="spec"):
+    """Validate ``documents`` and yield the slide plan they describe."""
+    spec = dict(DEFAULT_SPEC)
+    first = True
+    for n, doc in enumerate(documents, 1):
+        loc = f"{where}: document {n}"
+        if isinstance(doc, dict) and "builder" in doc:
+            validate_slide(doc, loc)
+            inputs, each = SECTIONS[doc["builder"]]
+            data = {key: doc.get(key, spec[key]) for key in inputs}
+            if each:
+                data["item"] = doc["item"]
+            yield doc["builder"], data
+        else:
+            validate_spec(doc, loc)
+            spec.update(doc)
+            if first or "slides" in doc:
+                yield from plan_deck(dict(spec, slides=doc.get("slides", spec["slides"])))
+        first = False
+
+# ── Compiled plan cache ────────────────────────────────────────────────────
+def _replay(path):
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+def load_plan(path, cache_dir=None):
+    """Yield the validated ``(builder name, data)`` plan of spec file ``path``."""
+    path = os.fspath(path)
+    cache_dir = os.path.join(cache_dir or CACHE_DIR, "specs")
+    key = hashlib.sha256(f"{file_hash(path)}-{code_version()}-{file_hash(__file__)}".encode()).hexdigest()
+    cached = os.path.join(cache_dir, f"{key}.plan")
+    if os.path.exists(cached):
+        yield from _replay(cached)
+        return
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for entry in compile_documents(_documents(path), path):
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+                yield entry
+        os.replace(tmp, cached)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)  # invalid spec or abandoned iteration: cache nothing
+
+def dump_spec(path, spec=None):
+    """Write ``spec`` (default: the built-in deck) as a JSON spec file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(spec or DEFAULT_SPEC, f, ensure_ascii=False, indent=2)
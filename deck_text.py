@@ -0,0 +1,199 @@
+"""
+Fine Jewellery's — text measurement for auto-fitting text boxes.
+
+``fit_font_size(text, width, height, font, size)`` returns the largest size
+(down to ``MIN_SIZE``, in ``STEP`` point steps) at which ``text`` wrapped
+into a ``width`` × ``height`` EMU box fits — the same greedy word wrap
+PowerPoint applies, measured here instead of in PowerPoint.
+
+Widths come from per-font glyph advance tables.  When the real font file
+is found (``DECK_FONT_DIR`` or the usual system font folders) and Pillow
+is available, advances are read from it; otherwise built-in approximations
+of Calibri and Georgia are used.  Tables are filled once per character,
+and ``text_width`` is memoised per (font, size, string), so fitting every
+text box of a several-thousand-slide deck costs little more than the
+distinct strings in it.
+"""
+
+import os
+import unicodedata
+from functools import lru_cache
+
+EMU_PER_PT = 12700
+UPM = 2048                    # table units per em
+INSET_X = 2 * 91440           # default left + right text box insets (0.1")
+INSET_Y = 2 * 45720           # default top + bottom insets (0.05")
+LINE_SPACING = 1.2            # single line pitch, in ems
+BOLD_WIDEN = 1.05             # approximated bold, when no bold font file is found
+MIN_SIZE = 7.0
+STEP = 0.5
+
+# Advance widths of " !\"#$%&'()*+,-./0-9:;<=>?@A-Z[\\]^_`a-z{|}~" in 1/2048 em,
+# approximating the Windows faces.
+_ASCII = "".join(chr(c) for c in range(32, 127))
+_APPROX = {
+    "Calibri": (
+        463, 548, 721, 1018, 1039, 1463, 1404, 394, 621, 621, 1019, 1019, 511, 627, 517, 791,
+        *[1038] * 10,
+        548, 548, 1019, 1019, 1019, 949, 1833,
+        1185, 1114, 1092, 1260, 1000, 941, 1292, 1276, 516, 653, 1064, 861, 1751,
+        1322, 1356, 1058, 1378, 1112, 941, 998, 1314, 1162, 1822, 1063, 998, 959,
+        628, 791, 628, 1019, 1019, 587,
+        981, 1076, 866, 1076, 1019, 625, 964, 1076, 470, 490, 931, 470, 1636,
+        1076, 1080, 1076, 1076, 714, 801, 686, 1076, 925, 1464, 887, 927, 809,
+        644, 941, 644, 1019),
+    "Georgia": (
+        494, 646, 796, 1300, 1207, 1598, 1455, 438, 752, 752, 937, 1207, 549, 762, 549, 963,
+        *[1254] * 10,
+        549, 549, 1207, 1207, 1207, 967, 1886,
+        1374, 1339, 1315, 1509, 1339, 1221, 1474, 1668, 794, 1039, 1420, 1230, 1816,
+        1563, 1519, 1258, 1519, 1428, 1166, 1266, 1532, 1378, 2036, 1434, 1292, 1220,
+        752, 963, 752, 1207, 1207, 1024,
+        1030, 1138, 960, 1151, 1018, 702, 1026, 1195, 599, 575, 1071, 589, 1782,
+        1206, 1108, 1147, 1120, 866, 889, 681, 1185, 1020, 1532, 1019, 1000, 910,
+        752, 762, 752, 1207),
+}
+
+FONT_FILES = {
+    ("Calibri", False): "calibri.ttf", ("Calibri", True): "calibrib.ttf",
+    ("Georgia", False): "georgia.ttf", ("Georgia", True): "georgiab.ttf",
+}
+
+def _font_dirs():
+    home = os.path.expanduser("~")
+    dirs = [os.environ.get("DECK_FONT_DIR"), "/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts"),
+            "/Library/Fonts", os.path.join(home, "Library", "Fonts"), r"C:\Windows\Fonts"]
+    return [d for d in dirs if d and os.path.isdir(d)]
+
+_font_paths = None
+
+def find_font(font, bold=False):
+    """Path of the font file for ``font`` (bold or regular), or None."""
+    global _font_paths
+    if _font_paths is None:
+        wanted = set(FONT_FILES.values())
+        _font_paths = {}
+        for top in _font_dirs():
+            for folder, _, files in os.walk(top):
+                for name in files:
+                    if name.lower() in wanted:
+                        _font_paths.setdefault(name.lower(), os.path.join(folder, name))
+    filename = FONT_FILES.get((font, bold))
+    return _font_paths.get(filename) if filename else None
+
+def metrics_source():
+    """``[(font file, path, size, mtime_ns)]`` of the font files text is
+    measured with — path None where the built-in approximation is used.
+    Auto-fitted font sizes depend on it, so cached slides are keyed on it."""
+    source = []
+    for (font, bold), filename in sorted(FONT_FILES.items()):
+        path = find_font(font, bold)
+        st = os.stat(path) if path else None
+        source.append((filename, path, st.st_size if st else None, st.st_mtime_ns if st else None))
+    return source
+
+# ── Glyph tables ───────────────────────────────────────────────────────────
+class GlyphWidths(dict):
+    """char -> advance in 1/``UPM`` em, measured on first lookup."""
+
+    def __init__(self, measure, scale=1.0):
+        super().__init__()
+        self._measure = measure
+        self.scale = scale      # applied to whole strings, see text_width
+
+    def __missing__(self, ch):
+        width = self[ch] = self._measure(ch)
+        return width
+
+def _fallback_width(ch, average):
+    if unicodedata.category(ch) in ("Mn", "Me", "Cf") or 0xFE00 <= ord(ch) <= 0xFE0F:
+        return 0                                   # combining marks, variation selectors
+    if unicodedata.east_asian_width(ch) in ("W", "F") or ord(ch) >= 0x1F000:
+        return UPM                                 # emoji and wide glyphs: a full em
+    return average
+
+def _approx_table(font):
+    table = dict(zip(_ASCII, _APPROX.get(font, _APPROX["Calibri"])))
+    average = sum(table.values()) // len(table)
+    return lambda ch: table[ch] if ch in table else _fallback_width(ch, average)
+
+def _file_table(path):
+    from PIL import ImageFont
+    face = ImageFont.truetype(path, UPM)
+    average = face.getlength("x" * 26) / 26 * 1.1
+    return lambda ch: face.getlength(ch) or _fallback_width(ch, average)
+
+_tables = {}
+
+def glyph_widths(font, bold=False):
+    """The (cached) ``GlyphWidths`` of ``font``."""
+    table = _tables.get((font, bold))
+    if table is None:
+        path = find_font(font, bold)
+        regular = find_font(font) if bold and path is None else None
+        try:
+            if path or regular:
+                table = GlyphWidths(_file_table(path or regular), 1.0 if path else BOLD_WIDEN)
+        except (ImportError, OSError):
+            table = None
+        if table is None:
+            table = GlyphWidths(_approx_table(font), BOLD_WIDEN if bold else 1.0)
+        _tables[font, bold] = table
+    return table
+
+# ── Measuring ──────────────────────────────────────────────────────────────
+@lru_cache(maxsize=1 << 16)
+def text_width(text, font="Calibri", size=14.0, bold=False):
+    """Advance width of ``text`` set in ``font`` at ``size`` points, in EMU."""
+    table = glyph_widths(font, bold)
+    return sum(table[ch] for ch in text) * table.scale * size * EMU_PER_PT / UPM
+
+def line_count(text, width, font="Calibri", size=14.0, bold=False):
+    """Lines ``text`` wraps to in a box ``width`` EMU wide (insets included)."""
+    avail = max(width - INSET_X, 1)
+    space = text_width(" ", font, size, bold)
+    lines = 0
+    for paragraph in text.split("\n"):
+        lines += 1
+        used = 0.0
+        for word in paragraph.split(" "):
+            w = text_width(word, font, size, bold)
+            if used and used + space + w <= avail:
+                used += space + w
+            elif w <= avail:
+                lines += bool(used)
+                used = w
+            else:                       # a word wider than the box breaks anywhere
+                lines += bool(used) + int(w // avail)
+                used = w % avail
+    return lines
+
+def wrap_lines(text, width, font="Calibri", size=14.0, bold=False):
+    """The lines ``text`` wraps to in a box ``width`` EMU wide, for drawing
+    (``line_count`` is the allocation-free variant used when fitting)."""
+    avail = max(width - INSET_X, 1)
+    space = text_width(" ", font, size, bold)
+    lines = []
+    for paragraph in text.split("\n"):
+        line, used = [], 0.0
+        for word in paragraph.split(" "):
+            w = text_width(word, font, size, bold)
+            if line and used + space + w > avail:
+                lines.append(" ".join(line))
+                line, used = [], 0.0
+            used += (space if line else 0.0) + w
+            line.append(word)
+        lines.append(" ".join(line))
+    return lines
+
+def fits(text, width, height, font="Calibri", size=14.0, bold=False):
+    pitch = size * LINE_SPACING * EMU_PER_PT
+    return line_count(text, width, font, size, bold) * pitch <= height - INSET_Y
+
+@lru_cache(maxsize=1 << 14)
+def fit_font_size(text, width, height, font="Calibri", size=14.0, bold=False, min_size=MIN_SIZE):
+    """Largest size ≤ ``size`` (points) at which ``text`` fits the box."""
+    while size > min_size and not fits(text, width, height, font, size, bold):
+        size = max(size - STEP, min_size)
+    return size
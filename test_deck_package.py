@@ -0,0 +1,121 @@
+"""
+Fine Jewellery's — round-trip tests for the package writers.
+
+``save_presentation`` and ``PackageWriter`` assemble the zip themselves
+(parts compressed in parallel, written through zipfile internals), so each
+is checked against every kind of output it accepts: a path, a seekable
+``BytesIO`` and a write-only object.  A deck passes when ``testzip()``
+finds no bad member and python-pptx opens it again with every slide.
+
+Run with ``python -m pytest test_deck_package.py`` or ``python -m unittest``.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+import warnings
+import zipfile
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ.setdefault("DECK_CACHE_DIR", os.path.join(_tmp.name, "cache"))
+
+from PIL import Image
+from pptx import Presentation
+
+import deck_engine
+
+def tearDownModule():
+    _tmp.cleanup()
+
+class WriteOnly:
+    """An output with nothing but ``write``, like a socket's file object."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def getvalue(self):
+        return b"".join(self.chunks)
+
+class PackageRoundTrip(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        folder = _tmp.name
+        shot = os.path.join(folder, "shot.png")
+        Image.new("RGB", (640, 400), (191, 155, 48)).save(shot)
+        orders = os.path.join(folder, "orders.jsonl")
+        with open(orders, "w", encoding="utf-8") as f:
+            for n in range(40):
+                f.write(json.dumps({
+                    "_id": {"$oid": f"{n:024x}"}, "status": ("confirmed", "delivered", "cancelled")[n % 3],
+                    "createdAt": {"$date": f"2026-03-{n % 28 + 1:02d}T10:00:00Z"},
+                    "shippingAddress": {"state": ("Karnataka", "Kerala")[n % 2]},
+                    "items": [{"productId": f"FJ-{n % 7:04d}", "name": f"Ring {n % 7}",
+                               "category": "Rings", "quantity": 1 + n % 2, "price": 1000 + n}],
+                }) + "\n")
+        # Pictures (the same file on every screenshot slide, so media is
+        # shared), plain shapes, and chart parts with embedded workbooks.
+        cls.spec = {
+            "slides": ["title", "screenshots", "schema", "sales_summary", "sales_breakdown",
+                       "sales_trend", "thank_you"],
+            "screenshots": {key: shot for _, _, key, _ in deck_engine.DEFAULT_SPEC["screenshot_slides"]},
+            "orders": orders,
+        }
+        cls.slides = sum(1 for _ in deck_engine._plan(cls.spec))
+        cls.folder = folder
+
+    def _outputs(self):
+        path = os.path.join(self.folder, "deck.pptx")
+
+        def read_path():
+            with open(path, "rb") as f:
+                return f.read()
+
+        yield "path", path, read_path
+        stream = io.BytesIO()
+        yield "BytesIO", stream, stream.getvalue
+        write_only = WriteOnly()
+        yield "write-only", write_only, write_only.getvalue
+
+    def _check(self, data):
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            self.assertIsNone(zf.testzip())
+            names = zf.namelist()
+            self.assertEqual(len(names), len(set(names)))
+            self.assertTrue(any(n.startswith("ppt/media/") for n in names))
+            self.assertTrue(any(n.startswith("ppt/embeddings/") for n in names))
+        prs = Presentation(io.BytesIO(data))
+        self.assertEqual(len(prs.slides), self.slides)
+        return prs
+
+    def test_save_presentation(self):
+        for kind, output, read in self._outputs():
+            with self.subTest(output=kind), warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                deck_engine.build_deck(self.spec, output)
+                self._check(read())
+
+    def test_package_writer(self):
+        for kind, output, read in self._outputs():
+            with self.subTest(output=kind), warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                self.assertEqual(deck_engine.build_catalogue(self.spec, output), self.slides)
+                self._check(read())
+
+    def test_writers_agree(self):
+        saved, streamed = io.BytesIO(), io.BytesIO()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            deck_engine.build_deck(self.spec, saved)
+            deck_engine.build_catalogue(self.spec, streamed)
+        texts = [[[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+                  for slide in self._check(data.getvalue()).slides] for data in (saved, streamed)]
+        self.assertEqual(texts[0], texts[1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Fine Jewellery's — aggregation tests for the sales analytics.
+
+``aggregate`` has two implementations of its group-by sums and masks —
+NumPy when it is installed, plain loops otherwise — and both must give the
+same ``SalesReport``.
+
+Run with ``python -m pytest test_deck_sales.py`` or ``python -m unittest``.
+"""
+
+import math
+import unittest
+from unittest import mock
+
+import deck_sales
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def _orders():
+    statuses = ("confirmed", "delivered", "Cancelled", "pending", "refunded")
+    for n in range(500):
+        yield {
+            "_id": {"$oid": f"{n:024x}"},
+            "status": statuses[n % len(statuses)],
+            "createdAt": {"$date": f"2026-0{n % 3 + 1}-{n % 27 + 1:02d}T09:30:00Z"},
+            "shippingAddress": {"state": ("Karnataka", "Kerala", "Goa", "")[n % 4], "city": "Panaji"},
+            "totalAmount": None if n % 7 == 0 else 1000 + n * 3,
+            "items": [{"productId": f"FJ-{(n * k) % 23:04d}", "name": f"Ring {(n * k) % 23}",
+                       "category": ("Rings", "Necklaces", None)[(n + k) % 3],
+                       "quantity": 1 + (n + k) % 3, "price": 250.5 * k} for k in range(1, n % 4 + 1)],
+        }
+
+def _columns():
+    columns = deck_sales.OrderColumns()
+    for order in _orders():
+        columns.add(order)
+    return columns
+
+def _close(a, b):
+    if isinstance(a, float) or isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_close(x, y) for x, y in zip(a, b))
+    return a == b
+
+class Aggregate(unittest.TestCase):
+    def _report(self, np):
+        with mock.patch.object(deck_sales, "_numpy", lambda: np):
+            return deck_sales.aggregate(_columns())
+
+    def test_fallback_totals(self):
+        report = self._report(None)
+        counted = [o for o in _orders() if o["status"].lower() not in deck_sales.EXCLUDED_STATUSES]
+        self.assertEqual(report.orders, len(counted))
+        self.assertEqual(report.units, sum(i["quantity"] for o in counted for i in o["items"]))
+        self.assertTrue(math.isclose(report.revenue, sum(
+            o["totalAmount"] if o["totalAmount"] is not None else sum(i["quantity"] * i["price"] for i in o["items"])
+            for o in counted)))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_matches_fallback(self):
+        fast, slow = self._report(numpy), self._report(None)
+        for field in deck_sales.SalesReport._fields:
+            with self.subTest(field=field):
+                self.assertTrue(_close(getattr(fast, field), getattr(slow, field)),
+                                f"{getattr(fast, field)!r} != {getattr(slow, field)!r}")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_empty_export(self):
+        self.assertEqual(deck_sales.aggregate(deck_sales.OrderColumns()).orders, 0)
+
+if __name__ == "__main__":
+    unittest.main()
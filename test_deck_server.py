@@ -0,0 +1,102 @@
+"""
+Fine Jewellery's — HTTP tests for the deck render service.
+
+A ``RenderService`` is served on an ephemeral 127.0.0.1 port and spoken to
+with raw HTTP/1.1, covering the answers that are not a deck: 400 for a
+malformed request or an invalid spec (as reported by ``deck_spec``) and
+503 with ``Retry-After`` once the render queue is full.
+
+Run with ``python -m pytest test_deck_server.py`` or ``python -m unittest``.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ.setdefault("DECK_CACHE_DIR", _tmp.name)
+
+from deck_server import RenderService
+
+def tearDownModule():
+    _tmp.cleanup()
+
+async def _request(port, method, path, body=None, raw=None):
+    """Send one request; return ``(status, headers, body)``."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    if raw is None:
+        data = json.dumps(body).encode() if body is not None else b""
+        raw = (f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n\r\n"
+               .encode("latin-1") + data)
+    try:
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), headers, payload
+
+class _Served(unittest.IsolatedAsyncioTestCase):
+    workers, queue_size, start_pool = 1, 1, True
+
+    async def asyncSetUp(self):
+        self.service = RenderService(self.workers, self.queue_size)
+        if self.start_pool:
+            self.service.start()
+        self.server = await asyncio.start_server(self.service.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        if self.start_pool:
+            await self.service.close()
+
+class BadRequests(_Served):
+    async def test_invalid_spec_is_400(self):
+        for spec, message in [({"stats": [[1, 2]]}, b"'stats' entries"),
+                              ({"products": [{"name": "x"}]}, b"needs ['sku']"),
+                              ({"slides": ["nope"]}, b"unknown slide section"),
+                              ({"colour": "gold"}, b"unknown spec key")]:
+            with self.subTest(spec=spec):
+                status, _, body = await _request(self.port, "POST", "/render", spec)
+                self.assertEqual(status, 400)
+                self.assertIn(message, body)
+        self.assertEqual(self.service.metrics()["failed"], 4)
+
+    async def test_non_object_spec_is_400(self):
+        status, _, body = await _request(self.port, "POST", "/render", ["title"])
+        self.assertEqual((status, body), (400, b"spec must be a JSON object"))
+
+    async def test_malformed_request_is_400(self):
+        status, _, _ = await _request(self.port, None, None, raw=b"GARBAGE\r\n\r\n")
+        self.assertEqual(status, 400)
+        status, _, _ = await _request(self.port, None, None,
+                                      raw=b"POST /render HTTP/1.1\r\nContent-Length: 5\r\n\r\n{nope")
+        self.assertEqual(status, 400)
+
+class Backpressure(_Served):
+    # No dispatchers: the first request stays queued, so the queue is full.
+    start_pool = False
+
+    async def test_full_queue_is_503(self):
+        waiting = asyncio.create_task(_request(self.port, "POST", "/render", {}))
+        while self.service.queue.qsize() < self.queue_size:
+            await asyncio.sleep(0.01)
+        status, headers, body = await _request(self.port, "POST", "/render", {})
+        self.assertEqual((status, body), (503, b"render queue full"))
+        self.assertEqual(headers.get("Retry-After"), "1")
+        metrics = json.loads((await _request(self.port, "GET", "/metrics"))[2])
+        self.assertEqual((metrics["rejected"], metrics["queue_depth"]), (1, 1))
+        _, future = self.service.queue.get_nowait()            # stand in for a dispatcher
+        future.set_result((200, "text/plain", b"done"))
+        self.assertEqual((await waiting)[0], 200)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Fine Jewellery's — rebuild tests for slide snapshots.
+
+A slide grafted from a snapshot — out of the cross-deck ``SlideCache`` or
+out of the previous output of an incremental build — must be
+indistinguishable from the slide its builder draws.  Decks are compared
+shape by shape (name, box, text, image hash) with ``deck_verify``'s
+streaming reader.
+
+Run with ``python -m pytest test_deck_snapshots.py`` or ``python -m unittest``.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+import warnings
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ.setdefault("DECK_CACHE_DIR", os.path.join(_tmp.name, "cache"))
+
+from PIL import Image
+
+import deck_engine
+from deck_snapshots import SlideCache
+from deck_verify import read_slides
+
+def tearDownModule():
+    _tmp.cleanup()
+
+def _shapes(deck):
+    return [slide.shapes for slide in read_slides(deck)]
+
+class Rebuilds(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        keys = [key for _, _, key, _ in deck_engine.DEFAULT_SPEC["screenshot_slides"]]
+        cls.shots = {key: os.path.join(_tmp.name, f"{key}.png") for key in keys}
+        for n, path in enumerate(cls.shots.values()):
+            Image.new("RGB", (800, 500), (40 * n, 120, 200)).save(path)
+        cls.spec = {"slides": ["title", "tech_stack", "screenshots", "architecture", "schema"],
+                    "screenshots": cls.shots}
+
+    def setUp(self):
+        self._cache = deck_engine.SLIDE_CACHE
+        self._builders = dict(deck_engine.SLIDE_BUILDERS)
+        self.built = []
+        for name, builder in self._builders.items():
+            def counted(slide, _name=name, _fn=builder.fn, **data):
+                self.built.append(_name)
+                return _fn(slide, **data)
+            deck_engine.SLIDE_BUILDERS[name] = builder._replace(fn=counted)
+        self.folder = tempfile.mkdtemp(dir=_tmp.name)
+        self.use_cache("cold")
+
+    def tearDown(self):
+        deck_engine.SLIDE_CACHE = self._cache
+        deck_engine.SLIDE_BUILDERS.update(self._builders)
+
+    def use_cache(self, name):
+        deck_engine.SLIDE_CACHE = SlideCache(os.path.join(self.folder, name))
+
+    def build(self, output=None, **options):
+        output = output or io.BytesIO()
+        self.built.clear()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            deck_engine.build_deck(self.spec, output, **options)
+        return output
+
+    def test_slide_cache_matches_full_build(self):
+        full = self.build()
+        cached = self.build()
+        self.assertNotIn("tech_stack", self.built)           # grafted from memory
+        deck_engine.SLIDE_CACHE = SlideCache(os.path.join(self.folder, "cold"))
+        from_disk = self.build()
+        self.assertNotIn("schema", self.built)               # grafted from disk
+        self.assertEqual(_shapes(cached), _shapes(full))
+        self.assertEqual(_shapes(from_disk), _shapes(full))
+
+    def test_incremental_matches_full_build(self):
+        path = os.path.join(self.folder, "deck.pptx")
+        self.build(path, incremental=True)
+        self.build(path, incremental=True)
+        self.assertEqual(self.built, [])                      # every slide grafted
+
+        Image.new("RGB", (800, 500), (250, 10, 10)).save(self.shots["cart"])
+        self.build(path, incremental=True)
+        self.assertEqual(self.built, ["screenshots"])         # only the cart slide
+        self.use_cache("full")
+        self.assertEqual(_shapes(path), _shapes(self.build()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Fine Jewellery's — validation tests for deck spec files.
+
+Every spec that passes ``validate_spec`` / ``validate_slide`` must build, so
+each shape a builder cannot draw is rejected here with a ``SpecError``:
+wrong entry arity or field types in the tuple lists, products without a
+sku or name or with mistyped fields, unknown keys and sections.
+
+Run with ``python -m pytest test_deck_spec.py`` or ``python -m unittest``.
+"""
+
+import copy
+import json
+import os
+import tempfile
+import unittest
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ.setdefault("DECK_CACHE_DIR", _tmp.name)
+
+import deck_spec
+from deck_content import DEFAULT_SPEC
+from deck_spec import SpecError, load_plan, validate_slide, validate_spec
+
+def tearDownModule():
+    _tmp.cleanup()
+
+PRODUCT = {"sku": "FJ-0001", "name": "Solitaire Ring", "category": "Rings", "price": 48500,
+           "details": ["18k gold", "0.5 ct"], "image": "/photos/ring.jpg"}
+
+BAD_SPECS = [
+    {"stats": [["1"]]},
+    {"stats": [[1, 2]]},
+    {"info": [["PROJECT TYPE", "Web", "extra"]]},
+    {"features": [["🔐", "Secure Auth"]]},
+    {"schemas": [["User", [["name"]]]]},
+    {"schemas": [["User", "name: String"]]},
+    {"screenshot_slides": [[4, "Home"]]},
+    {"screenshot_slides": [["4", "Home", "homepage", []]]},
+    {"screenshot_slides": [[4, "Home", "homepage", "one bullet"]]},
+    {"bullets": ["ok", 2]},
+    {"slides": [["title"]]},
+    {"slides": ["nope"]},
+    {"colour": "gold"},
+    {"stats": "15 slides"},
+    {"products": ["FJ-0001"]},
+    {"products": [{"name": "x"}]},
+    {"products": [dict(PRODUCT, sku="")]},
+    {"products": [dict(PRODUCT, price="1200")]},
+    {"products": [dict(PRODUCT, details="Gold")]},
+    {"products": [dict(PRODUCT, details=["Gold", 18])]},
+    {"products": [dict(PRODUCT, image=3)]},
+]
+
+BAD_SLIDES = [
+    {"builder": "products", "item": {"name": "x"}},
+    {"builder": "products", "item": dict(PRODUCT, price="1200")},
+    {"builder": "products"},
+    {"builder": "title", "stats": [[1, 2, 3]]},
+    {"builder": "title", "bullets": ["not a title input"]},
+    {"builder": "screenshots", "item": [4, "Home", "homepage", "not a list"]},
+    {"builder": "nope"},
+]
+
+class Validation(unittest.TestCase):
+    def test_default_spec_is_valid(self):
+        validate_spec(json.loads(json.dumps(DEFAULT_SPEC)))   # tuples as a JSON/YAML file has them
+
+    def test_valid_products(self):
+        validate_spec({"products": [PRODUCT, {"sku": "FJ-2", "name": "Band", "price": 999.5}]})
+        validate_slide({"builder": "products", "item": PRODUCT})
+
+    def test_rejects_malformed_specs(self):
+        for doc in BAD_SPECS:
+            with self.subTest(doc=doc), self.assertRaises(SpecError):
+                validate_spec(doc)
+
+    def test_rejects_malformed_slides(self):
+        for doc in BAD_SLIDES:
+            with self.subTest(doc=doc), self.assertRaises(SpecError):
+                validate_slide(doc)
+
+    def test_every_bad_spec_fails_only_its_key(self):
+        # each fixture is invalid for the one key it sets, not by accident
+        for doc in BAD_SPECS:
+            for key in doc:
+                if key in DEFAULT_SPEC:
+                    with self.subTest(key=key):
+                        fixed = copy.deepcopy(doc)
+                        fixed[key] = copy.deepcopy(DEFAULT_SPEC[key])
+                        validate_spec(json.loads(json.dumps(fixed)))
+
+class PlanCache(unittest.TestCase):
+    def test_cached_plan_revalidated_after_rule_change(self):
+        path = os.path.join(_tmp.name, "spec.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"slides": ["title"], "stats": [["1"]]}, f)
+        with self.assertRaises(SpecError):
+            list(load_plan(path))
+        # a plan compiled by a different deck_spec must not be replayed
+        real = deck_spec.file_hash
+        deck_spec.file_hash = lambda p: "older-rules" if p == deck_spec.__file__ else real(p)
+        try:
+            check, deck_spec._check_entry = deck_spec._check_entry, lambda *a: None
+            try:
+                self.assertEqual(len(list(load_plan(path))), 1)
+            finally:
+                deck_spec._check_entry = check
+        finally:
+            deck_spec.file_hash = real
+        with self.assertRaises(SpecError):
+            list(load_plan(path))
+
+if __name__ == "__main__":
+    unittest.main()